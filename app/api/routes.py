@@ -8,29 +8,48 @@ Endpoints:
 - POST /assess/audio: Upload audio and evaluate reading performance
 """
 
+import asyncio
+import hashlib
 import os
 import tempfile
+from contextlib import suppress
 from typing import Optional
 
 from fastapi import APIRouter, File, Form, UploadFile, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from app.services.asr_service import ASRService
 from app.services.text_service import TextService
 from app.services.evaluation_service import EvaluationService
 from app.services.chapter_service import ChapterService
-from app.utils.audio_utils import AudioProcessor
+from app.utils import audio_utils
 
 # Initialize router
 router = APIRouter()
 
+# Upload limits: audio is streamed to disk in fixed-size chunks
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024  # 50 MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# Maximum number of uploads decoded and transcribed at the same time.
+# Requests beyond this wait before decoding, so decoded waveforms don't
+# pile up in memory while the model is busy
+MAX_CONCURRENT_ASSESSMENTS = int(os.getenv("MAX_CONCURRENT_ASSESSMENTS", "2"))
+assessment_semaphore = asyncio.Semaphore(MAX_CONCURRENT_ASSESSMENTS)
+
+# Pass the start of the chapter to Whisper as its initial prompt. This
+# improves recognition of the chapter's vocabulary, but also biases the
+# model towards the expected text, which can hide misread or skipped
+# words and inflate accuracy/completeness; off by default
+ASR_USE_REFERENCE_PROMPT = os.getenv("ASR_USE_REFERENCE_PROMPT", "false").lower() in ("1", "true", "yes")
+
 # Initialize services
 asr_service = ASRService()
 text_service = TextService()
 evaluation_service = EvaluationService()
 chapter_service = ChapterService()
-audio_processor = AudioProcessor()
 
 
 # ===================== Response Models =====================
@@ -64,6 +83,22 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+# ===================== Helpers =====================
+
+def _rm(path: Optional[str]):
+    """Delete a temporary file, ignoring files that are already gone."""
+    if path is None:
+        return  # Never created
+    with suppress(OSError):  # Already removed, or not removable
+        os.unlink(path)
+
+
+def _retrieve_result(task: asyncio.Future):
+    """Mark a finished task's result as retrieved, so asyncio doesn't log its error."""
+    if not task.cancelled():
+        task.exception()
+
+
 # ===================== API Endpoints =====================
 
 @router.get(
@@ -132,54 +167,96 @@ async def assess_audio(
         )
     
     file_extension = os.path.splitext(audio.filename)[1].lower()
-    if file_extension not in ['.wav', '.mp3']:
+    if file_extension not in audio_utils.SUPPORTED_FORMATS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid audio format: {file_extension}. Supported formats: .wav, .mp3"
         )
     
-    # Retrieve reference text for the chapter
-    reference_text = chapter_service.get_chapter_text(chapter_id)
-    if reference_text is None:
+    # Check the chapter exists before accepting the upload
+    if chapter_service.get_chapter_text(chapter_id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Chapter with ID '{chapter_id}' not found"
         )
     
-    # Create temporary file to store uploaded audio
-    temp_file = None
+    # Prepare reference data for the chapter while the upload is received
+    # and decoded (normalized once per chapter, then served from cache)
+    reference_task = asyncio.ensure_future(run_in_threadpool(
+        chapter_service.get_reference,
+        chapter_id, 
+        text_service.normalize
+    ))
+    
+    # Path of the temporary file storing the uploaded audio
+    temp_file_path = None
     try:
-        # Save uploaded audio to temporary file
+        # Stream uploaded audio to a temporary file chunk by chunk,
+        # so memory use doesn't grow with the upload size
+        # The upload is hashed on the way so identical re-submissions
+        # reuse the cached transcript
+        hasher = hashlib.blake2b(digest_size=16)
+        total_bytes = 0
         with tempfile.NamedTemporaryFile(
             delete=False, 
             suffix=file_extension
         ) as temp_file:
-            content = await audio.read()
-            
-            # Check if audio file is empty
-            if len(content) == 0:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Uploaded audio file is empty"
-                )
-            
-            temp_file.write(content)
             temp_file_path = temp_file.name
+            
+            while chunk := await audio.read(UPLOAD_CHUNK_SIZE):
+                total_bytes += len(chunk)
+                if total_bytes > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Uploaded audio file exceeds the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit"
+                    )
+                hasher.update(chunk)
+                temp_file.write(chunk)
         
-        # Process audio (convert to required format if needed)
-        processed_audio_path = audio_processor.process_audio(temp_file_path)
-        
-        # Get audio duration for fluency calculation
-        audio_duration = audio_processor.get_duration(processed_audio_path)
-        
-        if audio_duration is None or audio_duration < 0.5:
+        # Check if audio file is empty
+        if total_bytes == 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Audio file is too short or invalid"
+                detail="Uploaded audio file is empty"
             )
         
-        # Convert speech to text using ASR
-        transcript = asr_service.transcribe(processed_audio_path)
+        audio_digest = hasher.hexdigest()
+        
+        async with assessment_semaphore:
+            # Decode audio once into a 16kHz mono waveform for Whisper
+            # Blocking work runs in the threadpool to keep the event loop free
+            audio_samples = await run_in_threadpool(
+                audio_utils.decode_to_array, 
+                temp_file_path
+            )
+            
+            # Get audio duration for fluency calculation
+            audio_duration = len(audio_samples) / audio_utils.TARGET_SAMPLE_RATE
+            
+            if audio_duration < 0.5:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Audio file is too short or invalid"
+                )
+            
+            reference = await reference_task
+            if reference is None:
+                # Chapter was deleted while the upload was in progress
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Chapter with ID '{chapter_id}' not found"
+                )
+            
+            # Convert speech to text using ASR
+            # Optionally pass the chapter text as prompt to bias recognition towards it
+            transcript = await asr_service.atranscribe(
+                audio_samples, 
+                cache_key=audio_digest,
+                initial_prompt=reference["prompt"] if ASR_USE_REFERENCE_PROMPT else None
+            )
+            
+            # The model is done with the waveform, so its buffer can be reused
+            audio_utils.release(audio_samples)
         
         if not transcript or transcript.strip() == "":
             raise HTTPException(
@@ -187,14 +264,15 @@ async def assess_audio(
                 detail="Could not transcribe any speech from the audio. Please ensure the audio contains clear speech."
             )
         
-        # Normalize both texts for comparison
+        # Normalize transcript for comparison
         normalized_transcript = text_service.normalize(transcript)
-        normalized_reference = text_service.normalize(reference_text)
         
         # Perform text comparison and calculate metrics
-        comparison_result = text_service.compare_texts(
+        comparison_result = await run_in_threadpool(
+            text_service.compare_texts,
             student_text=normalized_transcript,
-            reference_text=normalized_reference
+            reference_text=reference["normalized"],
+            reference_tokens=reference["tokens"]
         )
         
         # Calculate evaluation metrics
@@ -205,20 +283,22 @@ async def assess_audio(
         )
         
         # Generate response
-        return EvaluationResponse(
-            accuracy=round(evaluation_result['accuracy'], 2),
-            completeness=round(evaluation_result['completeness'], 2),
-            fluency_wpm=round(evaluation_result['fluency_wpm'], 1),
-            remarks=evaluation_result['remarks'],
-            transcript=transcript,
-            suspicious=evaluation_result.get('suspicious', False),
-            details={
+        # Fields match EvaluationResponse (kept as response_model for the docs);
+        # returning the response directly skips re-validating it with Pydantic
+        return ORJSONResponse({
+            "accuracy": round(evaluation_result['accuracy'], 2),
+            "completeness": round(evaluation_result['completeness'], 2),
+            "fluency_wpm": round(evaluation_result['fluency_wpm'], 1),
+            "remarks": evaluation_result['remarks'],
+            "transcript": transcript,
+            "suspicious": evaluation_result.get('suspicious', False),
+            "details": {
                 "matched_words": comparison_result['matched_words'],
                 "total_student_words": comparison_result['total_student_words'],
                 "total_reference_words": comparison_result['total_reference_words'],
                 "audio_duration_seconds": round(audio_duration, 2)
             }
-        )
+        })
         
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -230,20 +310,15 @@ async def assess_audio(
             detail=f"An error occurred while processing the audio: {str(e)}"
         )
     finally:
-        # Cleanup temporary files
-        if temp_file and os.path.exists(temp_file_path):
-            try:
-                os.unlink(temp_file_path)
-            except Exception:
-                pass  # Ignore cleanup errors
+        # Don't leave the reference lookup running if the request failed early.
+        # A lookup already running in its thread can't be interrupted and may
+        # still fail, so retrieve its outcome once it finishes
+        reference_task.cancel()
+        reference_task.add_done_callback(_retrieve_result)
         
-        # Cleanup processed audio if different from temp file
-        if 'processed_audio_path' in locals() and processed_audio_path != temp_file_path:
-            try:
-                if os.path.exists(processed_audio_path):
-                    os.unlink(processed_audio_path)
-            except Exception:
-                pass
+        # Cleanup temporary file (audio is decoded in memory, so
+        # the upload is the only file written)
+        _rm(temp_file_path)
 
 
 @router.get(
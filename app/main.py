@@ -10,10 +10,23 @@ Author: Intern
 Date: January 2026
 """
 
+import asyncio
+import logging
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+
+from app.api.routes import router as api_router, asr_service, chapter_service
 
-from app.api.routes import router as api_router
+# Configure logging once for the whole application
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI application with metadata
 app = FastAPI(
@@ -30,18 +43,32 @@ app = FastAPI(
     """,
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # Serialize responses with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse
+)
+
+# Allowed CORS origins, comma-separated (e.g. "https://app.example.com")
+# In production, specify allowed origins instead of the "*" wildcard
+CORS_ORIGINS = tuple(
+    origin.strip() 
+    for origin in os.getenv("CORS_ORIGINS", "*").split(",") 
+    if origin.strip()
 )
 
 # Configure CORS middleware for cross-origin requests
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify allowed origins
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (e.g. evaluations with full transcripts)
+# Added last so it is the outermost middleware
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Include API routes
 app.include_router(api_router)
 
@@ -50,19 +77,28 @@ app.include_router(api_router)
 async def startup_event():
     """
     Startup event handler - runs when the application starts.
-    Can be used for initializing resources like database connections.
+    Preloads and warms up the Whisper model so the first request
+    doesn't pay the model loading cost.
     """
-    print("🚀 Reading Evaluation Module is starting up...")
-    print("📚 Service ready to evaluate student readings!")
+    logger.info("🚀 Reading Evaluation Module is starting up...")
+    
+    # Load the model off the event loop; serving starts once it's warm
+    await asyncio.to_thread(asr_service.warmup)
+    
+    # Coalesce chapter edits into periodic background writes
+    chapter_service.start_background_flush()
+    
+    logger.info("📚 Service ready to evaluate student readings!")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """
     Shutdown event handler - runs when the application stops.
-    Can be used for cleanup tasks.
+    Writes any pending chapter changes to disk.
     """
-    print("👋 Reading Evaluation Module is shutting down...")
+    logger.info("👋 Reading Evaluation Module is shutting down...")
+    await chapter_service.stop_background_flush()
 
 
 # Entry point for running with uvicorn directly
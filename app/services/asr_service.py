@@ -5,11 +5,414 @@ Handles speech-to-text conversion using OpenAI Whisper.
 
 This service provides functionality to transcribe audio files
 containing student speech into text for evaluation.
+
+Three inference backends are supported:
+- faster-whisper (default): CTranslate2 re-implementation of Whisper
+  with int8/float16 kernels
+- whisper.cpp: GGML implementation (via pywhispercpp) with quantized
+  CPU kernels and no PyTorch dependency
+- openai-whisper: reference PyTorch implementation. On CPU its Linear
+  layers are dynamically quantized to int8.
+
+When faster-whisper is not installed, whisper.cpp is used if available,
+then openai-whisper.
 """
 
+import asyncio
+import importlib.util
+import logging
 import os
-from typing import Optional
-import whisper
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import ctranslate2
+    from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class _FasterWhisperBackend:
+    """
+    Whisper inference through faster-whisper (CTranslate2).
+    
+    Uses VAD to skip silence and decodes speech chunks of a recording
+    in batches with BatchedInferencePipeline.
+    """
+    
+    name = "faster-whisper"
+    
+    def __init__(self, model_size: str, device: str, compute_type: str, batch_size: int):
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        self.batch_size = batch_size
+        self._model = None
+        self._pipeline = None
+    
+    @staticmethod
+    def cuda_available() -> bool:
+        """Check whether CTranslate2 can see a CUDA device."""
+        return ctranslate2.get_cuda_device_count() > 0
+    
+    @property
+    def model(self):
+        """Lazily loaded faster-whisper model."""
+        if self._model is None:
+            self._model = WhisperModel(
+                self.model_size,
+                device=self.device,
+                compute_type=self.compute_type,
+                cpu_threads=os.cpu_count() or 0
+            )
+        return self._model
+    
+    @property
+    def pipeline(self) -> "BatchedInferencePipeline":
+        """
+        Batched inference pipeline wrapping the model.
+        
+        Splits a recording into speech chunks with VAD and runs the
+        chunks through the model in batches instead of one by one.
+        """
+        if self._pipeline is None:
+            self._pipeline = BatchedInferencePipeline(model=self.model)
+        return self._pipeline
+    
+    def warmup(self, silence: np.ndarray):
+        # VAD is disabled so the silent clip still reaches the encoder and decoder
+        segments, _ = self.model.transcribe(silence, language="en", beam_size=1)
+        for _ in segments:
+            pass
+    
+    def transcribe(
+        self, 
+        audio: Union[str, np.ndarray], 
+        language: Optional[str], 
+        initial_prompt: Optional[str]
+    ) -> str:
+        # Options explained:
+        # - vad_filter=True: Skip silent parts before decoding
+        # - beam_size=1: Greedy decoding, fastest on CPU
+        # - language: Specify language to improve accuracy
+        # - initial_prompt: Known reference text, if any
+        options = dict(
+            language=language,
+            vad_filter=True,
+            beam_size=1,
+            initial_prompt=initial_prompt
+        )
+        
+        if self.batch_size > 1:
+            # Speech chunks of the recording are decoded batch_size at a time
+            segments, _ = self.pipeline.transcribe(
+                audio,
+                batch_size=self.batch_size,
+                **options
+            )
+        else:
+            segments, _ = self.model.transcribe(audio, **options)
+        
+        # Segments are generated lazily; joining them runs the decoder
+        return "".join(segment.text for segment in segments).strip()
+    
+    def transcribe_with_timestamps(
+        self, 
+        audio: Union[str, np.ndarray], 
+        language: Optional[str]
+    ) -> Tuple[List[dict], Optional[str]]:
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            vad_filter=True,
+            beam_size=1,
+            word_timestamps=True  # Enable word-level timestamps
+        )
+        
+        segment_list = [
+            {
+                "id": segment.id,
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "words": [
+                    {
+                        "word": word.word,
+                        "start": word.start,
+                        "end": word.end,
+                        "probability": word.probability
+                    }
+                    for word in (segment.words or [])
+                ]
+            }
+            for segment in segments
+        ]
+        return segment_list, info.language
+    
+    def compute_features(self, audio: Union[str, np.ndarray]) -> np.ndarray:
+        if isinstance(audio, str):
+            audio = decode_audio(audio, sampling_rate=ASRService.SAMPLE_RATE)
+        
+        # The feature extractor holds the mel filterbank, built once at load time
+        n_samples = self.model.feature_extractor.n_samples
+        return self.model.feature_extractor(audio[:n_samples])
+    
+    def detect_language(self, features: np.ndarray) -> str:
+        detected_language, _, _ = self.model.detect_language(features=features)
+        return detected_language
+
+
+class _WhisperCppBackend:
+    """
+    Whisper inference through whisper.cpp (pywhispercpp bindings).
+    
+    Runs GGML models on CPU only. The model is downloaded on first use;
+    compute_type selects a quantized variant ("int8" maps to q8_0,
+    "q5_0"/"q5_1"/"q8_0" are used as given). model_size can also be
+    the path to a local ggml .bin file.
+    """
+    
+    name = "whisper.cpp"
+    
+    # compute_type -> GGML quantization suffix of the model name
+    QUANTIZATIONS = {
+        "int8": "q8_0",
+        "q5_0": "q5_0",
+        "q5_1": "q5_1",
+        "q8_0": "q8_0"
+    }
+    
+    def __init__(self, model_size: str, device: str, compute_type: str, batch_size: int):
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        self._model = None
+    
+    @staticmethod
+    def cuda_available() -> bool:
+        """The pywhispercpp wheels are CPU-only builds."""
+        return False
+    
+    @property
+    def model_name(self) -> str:
+        """GGML model name (or path) to load."""
+        if os.path.isfile(self.model_size):
+            return self.model_size
+        
+        quantization = self.QUANTIZATIONS.get(self.compute_type)
+        if quantization is None:
+            return self.model_size
+        return f"{self.model_size}-{quantization}"
+    
+    @property
+    def model(self):
+        """Lazily loaded whisper.cpp model."""
+        if self._model is None:
+            from pywhispercpp.model import Model
+            
+            self._model = Model(
+                self.model_name,
+                n_threads=os.cpu_count() or 4,
+                print_progress=False,
+                print_realtime=False
+            )
+        return self._model
+    
+    def warmup(self, silence: np.ndarray):
+        self.model.transcribe(silence, language="en")
+    
+    def transcribe(
+        self, 
+        audio: Union[str, np.ndarray], 
+        language: Optional[str], 
+        initial_prompt: Optional[str]
+    ) -> str:
+        params = dict(language=language or "auto")
+        if initial_prompt:
+            params["initial_prompt"] = initial_prompt
+        
+        segments = self.model.transcribe(audio, **params)
+        return "".join(segment.text for segment in segments).strip()
+    
+    def transcribe_with_timestamps(
+        self, 
+        audio: Union[str, np.ndarray], 
+        language: Optional[str]
+    ) -> Tuple[List[dict], Optional[str]]:
+        segments = self.model.transcribe(audio, language=language or "auto")
+        
+        # whisper.cpp reports times in 10ms units and has no
+        # word-level output in this mode
+        segment_list = [
+            {
+                "id": index,
+                "start": segment.t0 / 100,
+                "end": segment.t1 / 100,
+                "text": segment.text,
+                "words": []
+            }
+            for index, segment in enumerate(segments)
+        ]
+        return segment_list, language
+    
+    def compute_features(self, audio: Union[str, np.ndarray]):
+        # whisper.cpp computes the spectrogram internally, so the
+        # "features" are the first 30s window of the waveform
+        if isinstance(audio, str):
+            return audio
+        return audio[:ASRService.SAMPLE_RATE * 30]
+    
+    def detect_language(self, features) -> str:
+        (detected_language, _), _ = self.model.auto_detect_language(
+            features, 
+            n_threads=os.cpu_count() or 4
+        )
+        return detected_language
+
+
+class _OpenAIWhisperBackend:
+    """
+    Whisper inference through the reference openai-whisper package.
+    
+    Fallback for environments without faster-whisper. On CPU with
+    compute_type "int8", the model's Linear layers (the bulk of the
+    encoder/decoder compute) are dynamically quantized to int8.
+    """
+    
+    name = "openai-whisper"
+    
+    def __init__(self, model_size: str, device: str, compute_type: str, batch_size: int):
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        self._model = None
+    
+    @staticmethod
+    def cuda_available() -> bool:
+        """Check whether PyTorch can see a CUDA device."""
+        import torch
+        return torch.cuda.is_available()
+    
+    @property
+    def fp16(self) -> bool:
+        """Whether to run inference in half precision (GPU only)."""
+        return self.device == "cuda" and self.compute_type == "float16"
+    
+    @property
+    def model(self):
+        """Lazily loaded openai-whisper model."""
+        if self._model is None:
+            import torch
+            import whisper
+            
+            model = whisper.load_model(self.model_size, device=self.device)
+            if self.device == "cpu" and self.compute_type == "int8":
+                model = self._quantize(model)
+            self._model = model
+        return self._model
+    
+    @staticmethod
+    def _quantize(model):
+        """
+        Dynamically quantize the model's Linear layers to int8.
+        
+        openai-whisper builds its layers from its own nn.Linear subclass,
+        which quantize_dynamic only matches by exact type, so those
+        layers are first swapped for plain nn.Linear modules sharing the
+        same parameters.
+        """
+        import torch
+        from torch.ao.nn.quantized.dynamic import Linear as QuantizedLinear
+        
+        for parent in list(model.modules()):
+            for child_name, child in parent.named_children():
+                if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+                    linear = torch.nn.Linear(
+                        child.in_features, 
+                        child.out_features, 
+                        bias=child.bias is not None
+                    )
+                    linear.weight = child.weight
+                    linear.bias = child.bias
+                    setattr(parent, child_name, linear)
+        
+        model = torch.quantization.quantize_dynamic(
+            model, 
+            {torch.nn.Linear}, 
+            dtype=torch.qint8
+        )
+        
+        quantized = sum(isinstance(m, QuantizedLinear) for m in model.modules())
+        if quantized:
+            logger.info(f"Quantized {quantized} Linear layers to int8")
+        else:
+            logger.warning("int8 quantization found no Linear layers; running in float32")
+        return model
+    
+    def warmup(self, silence: np.ndarray):
+        self.model.transcribe(silence, language="en", fp16=self.fp16)
+    
+    def transcribe(
+        self, 
+        audio: Union[str, np.ndarray], 
+        language: Optional[str], 
+        initial_prompt: Optional[str]
+    ) -> str:
+        result = self.model.transcribe(
+            audio,
+            language=language,
+            fp16=self.fp16,
+            initial_prompt=initial_prompt
+        )
+        return result.get("text", "").strip()
+    
+    def transcribe_with_timestamps(
+        self, 
+        audio: Union[str, np.ndarray], 
+        language: Optional[str]
+    ) -> Tuple[List[dict], Optional[str]]:
+        result = self.model.transcribe(
+            audio,
+            language=language,
+            fp16=self.fp16,
+            word_timestamps=True  # Enable word-level timestamps
+        )
+        
+        segment_list = [
+            {
+                "id": segment["id"],
+                "start": segment["start"],
+                "end": segment["end"],
+                "text": segment["text"],
+                "words": segment.get("words", [])
+            }
+            for segment in result.get("segments", [])
+        ]
+        return segment_list, result.get("language")
+    
+    def compute_features(self, audio: Union[str, np.ndarray]):
+        import whisper
+        
+        if isinstance(audio, str):
+            audio = whisper.load_audio(audio)
+        
+        # Build the mel spectrogram directly on the model's device
+        return whisper.log_mel_spectrogram(
+            whisper.pad_or_trim(audio),
+            n_mels=self.model.dims.n_mels,
+            device=self.model.device
+        )
+    
+    def detect_language(self, features) -> str:
+        _, probs = self.model.detect_language(features)
+        return max(probs, key=probs.get)
 
 
 class ASRService:
@@ -18,45 +421,164 @@ class ASRService:
     
     Whisper is a general-purpose speech recognition model that
     supports multiple languages and can handle various audio qualities.
+    By default it runs through faster-whisper, which uses int8 GEMM
+    kernels on CPU for lower latency and memory usage.
     """
     
-    def __init__(self, model_size: str = "base"):
+    # Available inference backends, by name
+    BACKENDS = {
+        _FasterWhisperBackend.name: _FasterWhisperBackend,
+        _WhisperCppBackend.name: _WhisperCppBackend,
+        _OpenAIWhisperBackend.name: _OpenAIWhisperBackend
+    }
+    
+    # Sample rate expected by Whisper
+    SAMPLE_RATE = 16000
+    
+    # English-only model: smaller and faster than the multilingual "base"
+    # at the same accuracy on English speech. Override with WHISPER_MODEL.
+    DEFAULT_MODEL_SIZE = "base.en"
+    
+    # Default weight precision per device: float16 uses tensor cores on GPU,
+    # int8 uses the VNNI GEMM kernels on CPU (dynamic quantization for
+    # the openai-whisper backend)
+    DEFAULT_COMPUTE_TYPES = {
+        "cuda": "float16",
+        "cpu": "int8"
+    }
+    
+    def __init__(
+        self,
+        model_size: Optional[str] = None,
+        device: str = "auto",
+        compute_type: Optional[str] = None,
+        transcript_cache_size: int = 256,
+        batch_size: int = 8,
+        backend: Optional[str] = None
+    ):
         """
         Initialize the ASR service with specified Whisper model.
         
         Args:
             model_size: Size of Whisper model to use.
-                       Options: "tiny", "base", "small", "medium", "large"
+                       Options: "tiny.en", "base.en", "small.en", "distil-small.en",
+                       "medium.en" (English only) or "tiny", "base", "small",
+                       "medium", "large" (multilingual).
                        Larger models are more accurate but slower.
-                       Default is "base" for balance of speed and accuracy.
+                       If None, uses the WHISPER_MODEL environment variable,
+                       falling back to "base.en".
+            device: Device to run inference on ("cpu", "cuda" or "auto").
+                   "auto" picks CUDA when a GPU is available.
+            compute_type: Weight precision (e.g. "int8", "float16", "int8_float16").
+                         If None, uses "float16" on CUDA and "int8" on CPU.
+                         The openai-whisper backend supports "int8" (CPU),
+                         "float16" (CUDA) and "float32"; whisper.cpp
+                         supports "int8", "q5_0", "q5_1" and "q8_0".
+            transcript_cache_size: Maximum number of transcripts kept in the
+                                  content-hash cache (0 disables caching).
+            batch_size: Number of speech chunks of a recording decoded together
+                       in one encoder/decoder call. Set to 1 to decode
+                       chunks one after another (faster-whisper only).
+            backend: Inference backend, "faster-whisper", "whisper.cpp" or
+                    "openai-whisper". If None, uses the ASR_BACKEND environment
+                    variable, falling back to the first installed backend.
         """
-        self.model_size = model_size
-        self._model = None  # Lazy loading
+        if backend is None:
+            backend = os.getenv("ASR_BACKEND") or self._default_backend()
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown ASR backend: {backend}. "
+                f"Options: {list(self.BACKENDS)}"
+            )
+        backend_class = self.BACKENDS[backend]
+        
+        if device == "auto":
+            device = "cuda" if backend_class.cuda_available() else "cpu"
+        
+        self.backend = backend
+        self.model_size = model_size or os.getenv("WHISPER_MODEL", self.DEFAULT_MODEL_SIZE)
+        self.device = device
+        self.compute_type = compute_type or self.DEFAULT_COMPUTE_TYPES.get(device, "default")
+        self.batch_size = batch_size
         
+        # Model is loaded lazily by the backend
+        self._backend = backend_class(
+            self.model_size, 
+            self.device, 
+            self.compute_type, 
+            self.batch_size
+        )
+        
+        # LRU cache of transcripts keyed by (audio content hash, language, prompt)
+        self.transcript_cache_size = transcript_cache_size
+        self._transcript_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Inference runs on a single dedicated thread: one model instance
+        # should not serve several transcriptions at once
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asr")
+        
+    @staticmethod
+    def _default_backend() -> str:
+        """Pick the fastest installed backend."""
+        if FASTER_WHISPER_AVAILABLE:
+            return _FasterWhisperBackend.name
+        if importlib.util.find_spec("pywhispercpp") is not None:
+            return _WhisperCppBackend.name
+        return _OpenAIWhisperBackend.name
+    
     @property
     def model(self):
         """
         Lazy load the Whisper model to avoid loading on import.
         Model is loaded only when first transcription is requested.
         """
-        if self._model is None:
-            print(f"🎤 Loading Whisper model: {self.model_size}...")
-            self._model = whisper.load_model(self.model_size)
-            print("✅ Whisper model loaded successfully!")
-        return self._model
+        if self._backend._model is None:
+            logger.info(
+                "🎤 Loading Whisper model: %s (%s, %s, %s)...",
+                self.model_size, self.backend, self.device, self.compute_type
+            )
+            self._backend.model
+            logger.info("✅ Whisper model loaded successfully!")
+        return self._backend.model
+    
+    def warmup(self, duration_seconds: float = 1.0):
+        """
+        Load the model and run one dummy transcription.
+        
+        Meant to be called at application startup so the first real
+        request doesn't pay for model loading and first-run kernel setup.
+        
+        Args:
+            duration_seconds: Length of the silent warmup clip
+        """
+        silence = np.zeros(int(self.SAMPLE_RATE * duration_seconds), dtype=np.float32)
+        
+        self.model  # Load with progress messages
+        self._backend.warmup(silence)
     
     def transcribe(
         self, 
-        audio_path: str,
-        language: Optional[str] = "en"
+        audio: Union[str, np.ndarray],
+        language: Optional[str] = "en",
+        cache_key: Optional[str] = None,
+        initial_prompt: Optional[str] = None
     ) -> str:
         """
-        Transcribe audio file to text.
+        Transcribe audio to text.
         
         Args:
-            audio_path: Path to the audio file to transcribe
+            audio: Path to the audio file to transcribe, or an already
+                  decoded 16kHz mono float32 waveform
             language: Language code (e.g., "en" for English, "hi" for Hindi)
                      Set to None for automatic language detection.
+                     Ignored by English-only (".en") models.
+            cache_key: Optional hash of the audio content. When given, a
+                      previous transcript for the same content is returned
+                      without running the model again.
+            initial_prompt: Optional text to condition the model on, such as
+                           the passage being read. Biases recognition towards
+                           its vocabulary (names, terms).
                      
         Returns:
             Transcribed text from the audio
@@ -66,29 +588,94 @@ class ASRService:
             Exception: If transcription fails
         """
         # Validate audio file exists
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if isinstance(audio, str) and not os.path.exists(audio):
+            raise FileNotFoundError(f"Audio file not found: {audio}")
+        
+        # Return cached transcript for identical audio content
+        if cache_key is not None:
+            cached = self._get_cached_transcript((cache_key, language, initial_prompt))
+            if cached is not None:
+                return cached
         
         try:
-            # Perform transcription using Whisper
-            # Options explained:
-            # - fp16=False: Use FP32 for CPU compatibility
-            # - language: Specify language to improve accuracy
-            result = self.model.transcribe(
-                audio_path,
-                fp16=False,  # Set to True if using GPU
-                language=language
-            )
+            self.model  # Load with progress messages
+            transcript = self._backend.transcribe(audio, language, initial_prompt)
             
-            # Extract transcribed text
-            transcript = result.get("text", "").strip()
+            if cache_key is not None:
+                self._cache_transcript((cache_key, language, initial_prompt), transcript)
             
             return transcript
             
         except Exception as e:
-            print(f"❌ Transcription error: {str(e)}")
+            logger.error("❌ Transcription error: %s", e)
             raise Exception(f"Failed to transcribe audio: {str(e)}")
     
+    async def atranscribe(
+        self, 
+        audio: Union[str, np.ndarray],
+        language: Optional[str] = "en",
+        cache_key: Optional[str] = None,
+        initial_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Transcribe audio to text without blocking the event loop.
+        
+        Runs transcribe() on the service's inference thread, so async
+        callers (e.g. FastAPI endpoints) keep serving other requests
+        while the model is busy.
+        
+        Args:
+            audio: Path to the audio file, or a decoded 16kHz waveform
+            language: Language code, or None for automatic detection
+            cache_key: Optional hash of the audio content (see transcribe())
+            initial_prompt: Optional text to condition the model on
+            
+        Returns:
+            Transcribed text from the audio
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            self.transcribe,
+            audio,
+            language,
+            cache_key,
+            initial_prompt
+        )
+    
+    def _get_cached_transcript(self, key: tuple) -> Optional[str]:
+        """
+        Look up a transcript in the LRU cache, marking it as recently used.
+        
+        Args:
+            key: (content hash, language, initial prompt) tuple
+            
+        Returns:
+            Cached transcript, or None on a cache miss
+        """
+        with self._cache_lock:
+            transcript = self._transcript_cache.get(key)
+            if transcript is not None:
+                self._transcript_cache.move_to_end(key)
+            return transcript
+    
+    def _cache_transcript(self, key: tuple, transcript: str):
+        """
+        Store a transcript in the LRU cache, evicting the oldest entry if full.
+        
+        Args:
+            key: (content hash, language, initial prompt) tuple
+            transcript: Transcribed text
+        """
+        if self.transcript_cache_size <= 0:
+            return
+        
+        with self._cache_lock:
+            self._transcript_cache[key] = transcript
+            self._transcript_cache.move_to_end(key)
+            while len(self._transcript_cache) > self.transcript_cache_size:
+                self._transcript_cache.popitem(last=False)
+    
     def transcribe_with_timestamps(
         self, 
         audio_path: str,
@@ -111,63 +698,85 @@ class ASRService:
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
         try:
-            result = self.model.transcribe(
-                audio_path,
-                fp16=False,
-                language=language,
-                word_timestamps=True  # Enable word-level timestamps
+            self.model  # Load with progress messages
+            segment_list, detected_language = self._backend.transcribe_with_timestamps(
+                audio_path, 
+                language
             )
             
             return {
-                "text": result.get("text", "").strip(),
-                "segments": result.get("segments", []),
-                "language": result.get("language", language)
+                "text": "".join(segment["text"] for segment in segment_list).strip(),
+                "segments": segment_list,
+                "language": detected_language or language
             }
             
         except Exception as e:
             raise Exception(f"Failed to transcribe audio with timestamps: {str(e)}")
     
-    def detect_language(self, audio_path: str) -> str:
+    def compute_features(self, audio: Union[str, np.ndarray]):
         """
-        Detect the spoken language in an audio file.
+        Compute the log-mel spectrogram of an audio clip.
+        
+        Only the first 30s window is used, as that is all language
+        detection looks at. The returned features can be passed to
+        detect_language() repeatedly without recomputing the STFT.
         
         Args:
-            audio_path: Path to the audio file
+            audio: Path to the audio file, or a decoded 16kHz waveform
+            
+        Returns:
+            Log-mel features of shape (n_mels, n_frames): a NumPy array for
+            faster-whisper, a tensor on the model's device for openai-whisper
+        """
+        if isinstance(audio, str) and not os.path.exists(audio):
+            raise FileNotFoundError(f"Audio file not found: {audio}")
+        
+        self.model  # Load with progress messages
+        return self._backend.compute_features(audio)
+    
+    def detect_language(
+        self, 
+        audio: Union[str, np.ndarray, None] = None,
+        features=None
+    ) -> str:
+        """
+        Detect the spoken language in an audio clip.
+        
+        Args:
+            audio: Path to the audio file, or a decoded 16kHz waveform
+            features: Precomputed log-mel features from compute_features().
+                     Used instead of `audio` to skip feature extraction.
             
         Returns:
             Detected language code (e.g., "en", "hi", "mr")
         """
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if features is None and audio is None:
+            raise ValueError("Either audio or features must be provided")
+        
+        if isinstance(audio, str) and not os.path.exists(audio):
+            raise FileNotFoundError(f"Audio file not found: {audio}")
         
         try:
-            # Load audio and detect language
-            audio = whisper.load_audio(audio_path)
-            audio = whisper.pad_or_trim(audio)
-            
-            # Make log-Mel spectrogram
-            mel = whisper.log_mel_spectrogram(audio).to(self.model.device)
-            
-            # Detect language
-            _, probs = self.model.detect_language(mel)
-            detected_language = max(probs, key=probs.get)
+            if features is None:
+                features = self.compute_features(audio)
             
-            return detected_language
+            # Detect language from the first 30s window
+            return self._backend.detect_language(features)
             
         except Exception as e:
-            print(f"Language detection failed: {str(e)}")
+            logger.warning("Language detection failed: %s", e)
             return "en"  # Default to English
 
 
 # Singleton instance for reuse
 _asr_service_instance = None
 
-def get_asr_service(model_size: str = "base") -> ASRService:
+def get_asr_service(model_size: Optional[str] = None) -> ASRService:
     """
     Get singleton instance of ASR service.
     
     Args:
-        model_size: Whisper model size
+        model_size: Whisper model size (defaults to WHISPER_MODEL or "base.en")
         
     Returns:
         ASRService instance
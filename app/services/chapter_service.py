@@ -7,11 +7,18 @@ This service handles loading chapter data from JSON storage
 and provides methods to query chapter content.
 """
 
+import asyncio
 import json
+import logging
 import os
-from typing import Dict, List, Optional
+import threading
+from typing import Callable, Dict, List, Optional
 from pathlib import Path
 
+import orjson
+
+logger = logging.getLogger(__name__)
+
 
 class ChapterService:
     """
@@ -21,6 +28,9 @@ class ChapterService:
     methods to retrieve chapter content for evaluation.
     """
     
+    # Whisper keeps at most 223 prompt tokens; ~150 English words stay under that
+    PROMPT_MAX_WORDS = 150
+    
     def __init__(self, data_path: Optional[str] = None):
         """
         Initialize ChapterService.
@@ -36,6 +46,18 @@ class ChapterService:
         
         self.data_path = Path(data_path)
         self._chapters_cache = None
+        
+        # Precomputed reference data (see get_reference), keyed by chapter ID
+        self._reference_cache: Dict[str, Dict] = {}
+        
+        # Write coalescing: while the background flusher runs, edits only
+        # mark the data dirty and are written to disk together.
+        # _write_lock guards the dirty flag and the snapshot taken for a
+        # write; _file_lock keeps writes to the file in order
+        self._dirty = False
+        self._write_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
     
     def _load_chapters(self) -> Dict:
         """
@@ -52,16 +74,19 @@ class ChapterService:
             return self._chapters_cache
         
         if not self.data_path.exists():
-            print(f"⚠️ Chapters file not found at {self.data_path}")
-            print("Creating default chapters file...")
+            logger.warning(
+                "⚠️ Chapters file not found at %s, creating default chapters file...",
+                self.data_path
+            )
             self._create_default_chapters()
         
         try:
-            with open(self.data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # orjson parses the raw UTF-8 bytes directly, without a text decode pass
+            with open(self.data_path, 'rb') as f:
+                data = orjson.loads(f.read())
                 self._chapters_cache = data.get('chapters', {})
                 return self._chapters_cache
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise json.JSONDecodeError(
                 f"Invalid JSON in chapters file: {e.msg}",
                 e.doc,
@@ -95,10 +120,10 @@ class ChapterService:
         # Ensure directory exists
         self.data_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(self.data_path, 'w', encoding='utf-8') as f:
-            json.dump(default_data, f, indent=2, ensure_ascii=False)
+        with open(self.data_path, 'wb') as f:
+            f.write(orjson.dumps(default_data, option=orjson.OPT_INDENT_2))
         
-        print(f"✅ Created default chapters file at {self.data_path}")
+        logger.info("✅ Created default chapters file at %s", self.data_path)
     
     def get_chapter_text(self, chapter_id: str) -> Optional[str]:
         """
@@ -118,6 +143,54 @@ class ChapterService:
         
         return chapter.get('text', '')
     
+    def get_reference(
+        self, 
+        chapter_id: str, 
+        normalize: Callable[[str], str]
+    ) -> Optional[Dict]:
+        """
+        Get precomputed reference data for evaluating a reading of a chapter.
+        
+        Reference texts are static, so normalization, tokenization and the
+        ASR prompt are computed once per chapter and cached until the
+        chapter is modified or reloaded.
+        
+        Args:
+            chapter_id: Unique identifier for the chapter
+            normalize: Normalization function (e.g. TextService.normalize)
+            
+        Returns:
+            Dictionary with:
+            - text: Original chapter text
+            - normalized: Normalized chapter text
+            - tokens: Normalized word tokens
+            - prompt: Leading words of the chapter, used as the Whisper
+                      initial prompt to bias recognition towards its vocabulary
+            or None if the chapter is not found
+        """
+        reference = self._reference_cache.get(chapter_id)
+        if reference is not None:
+            return reference
+        
+        text = self.get_chapter_text(chapter_id)
+        if text is None:
+            return None
+        
+        normalized = normalize(text)
+        reference = {
+            "text": text,
+            "normalized": normalized,
+            "tokens": normalized.split(),
+            "prompt": " ".join(text.split()[:self.PROMPT_MAX_WORDS])
+        }
+        
+        # Edits replace the text and drop the cached entry under this lock,
+        # so only cache the entry if the chapter wasn't changed meanwhile
+        with self._write_lock:
+            if self.get_chapter_text(chapter_id) == text:
+                self._reference_cache[chapter_id] = reference
+        return reference
+    
     def get_chapter(self, chapter_id: str) -> Optional[Dict]:
         """
         Get full chapter details by ID.
@@ -176,12 +249,9 @@ class ChapterService:
             "text": text
         }
         
-        # Save to file
+        # Save to file (and update cache)
         self._save_chapters(chapters)
         
-        # Update cache
-        self._chapters_cache = chapters
-        
         return True
     
     def update_chapter(
@@ -210,10 +280,11 @@ class ChapterService:
             chapters[chapter_id]['title'] = title
         
         if text is not None:
-            chapters[chapter_id]['text'] = text
+            with self._write_lock:
+                chapters[chapter_id]['text'] = text
+                self._reference_cache.pop(chapter_id, None)
         
         self._save_chapters(chapters)
-        self._chapters_cache = chapters
         
         return True
     
@@ -232,10 +303,11 @@ class ChapterService:
         if chapter_id not in chapters:
             return False
         
-        del chapters[chapter_id]
+        with self._write_lock:
+            del chapters[chapter_id]
+            self._reference_cache.pop(chapter_id, None)
         
         self._save_chapters(chapters)
-        self._chapters_cache = chapters
         
         return True
     
@@ -243,19 +315,98 @@ class ChapterService:
         """
         Save chapters to JSON file.
         
+        The chapters become the cached data. If the background flusher
+        is running, the write is deferred and coalesced with other
+        edits; otherwise the file is written now.
+        
         Args:
             chapters: Dictionary of chapter data
         """
-        data = {"chapters": chapters}
+        with self._write_lock:
+            self._chapters_cache = chapters
+            self._dirty = True
+        
+        if self._flush_task is None:
+            self.flush()
+    
+    def flush(self):
+        """
+        Write pending chapter changes to disk.
+        
+        The file is written to a temporary path and renamed over
+        chapters.json, so readers never see a partially written file.
+        """
+        with self._file_lock:
+            with self._write_lock:
+                if not self._dirty or self._chapters_cache is None:
+                    return
+                
+                # Clear the flag before taking the snapshot, so an edit
+                # made after it marks the data dirty again
+                self._dirty = False
+                data = {"chapters": self._chapters_cache}
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            
+            try:
+                temp_path = self.data_path.with_suffix(self.data_path.suffix + '.tmp')
+                with open(temp_path, 'wb') as f:
+                    f.write(content)
+                os.replace(temp_path, self.data_path)
+            except Exception:
+                # Keep the changes pending so the next flush retries them
+                with self._write_lock:
+                    self._dirty = True
+                raise
+    
+    def start_background_flush(self, interval: float = 0.5):
+        """
+        Start coalescing chapter writes in a background task.
+        
+        Must be called from a running event loop (e.g. the FastAPI
+        startup handler). Pending changes are written every `interval`
+        seconds from a worker thread, off the event loop.
         
-        with open(self.data_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Args:
+            interval: Seconds between flushes
+        """
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_periodically(interval))
+    
+    async def stop_background_flush(self):
+        """
+        Stop the background flusher and write any pending changes.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                logger.exception("Background chapter flusher failed")
+            self._flush_task = None
+        
+        await asyncio.to_thread(self.flush)
+    
+    async def _flush_periodically(self, interval: float):
+        """
+        Background loop writing pending changes every `interval` seconds.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            if self._dirty:
+                try:
+                    await asyncio.to_thread(self.flush)
+                except Exception:
+                    # Changes stay dirty; log and retry on the next tick
+                    logger.exception("Failed to write chapters to %s", self.data_path)
     
     def reload_chapters(self):
         """
         Force reload chapters from file, clearing cache.
         """
         self._chapters_cache = None
+        self._reference_cache.clear()
         self._load_chapters()
 
 
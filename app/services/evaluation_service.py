@@ -10,7 +10,11 @@ Metrics calculated:
 - Suspicious flag: Detection of unusually fast reading
 """
 
-from typing import Dict, Optional
+from bisect import bisect_right
+from functools import cache
+from typing import Dict, Optional, Sequence
+
+import numpy as np
 
 
 class EvaluationService:
@@ -21,6 +25,9 @@ class EvaluationService:
     results and audio characteristics.
     """
     
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("suspicious_wpm_threshold", "min_completeness_for_valid")
+    
     # Standard WPM ranges for different reading levels
     WPM_RANGES = {
         "very_slow": (0, 60),
@@ -31,6 +38,14 @@ class EvaluationService:
         "suspicious": (250, float('inf'))
     }
     
+    # Speed categories in WPM order and the upper edges between them,
+    # for binary search instead of scanning WPM_RANGES
+    SPEED_LABELS = tuple(WPM_RANGES)
+    SPEED_EDGES = tuple(high for _, high in WPM_RANGES.values())[:-1]
+    
+    # Lowest and highest WPM covered by the categories
+    SPEED_BOUNDS = (WPM_RANGES[SPEED_LABELS[0]][0], WPM_RANGES[SPEED_LABELS[-1]][1])
+    
     # Thresholds for performance remarks
     ACCURACY_THRESHOLDS = {
         "excellent": 90,
@@ -39,6 +54,34 @@ class EvaluationService:
         "needs_improvement": 40
     }
     
+    # Remarks per accuracy band, lowest band first: band i covers
+    # ACCURACY_EDGES[i - 1] <= accuracy < ACCURACY_EDGES[i]
+    ACCURACY_EDGES = tuple(sorted(ACCURACY_THRESHOLDS.values()))
+    ACCURACY_REMARKS = (
+        "Significant improvement needed. Practice reading aloud.",
+        "Needs improvement. Focus on reading clearly.",
+        "Average performance. Practice pronunciation.",
+        "Good reading performance.",
+        "Excellent accuracy! Words are pronounced correctly."
+    )
+    
+    # Remarks per completeness band, lowest band first
+    COMPLETENESS_EDGES = (50, 80)
+    COMPLETENESS_REMARKS = (
+        "Only partial text was read.",
+        "Most of the text was covered.",
+        "Good coverage of the reference text."
+    )
+    
+    # Remarks per reading speed category (none for suspicious/unknown)
+    SPEED_REMARKS = {
+        "very_slow": "Reading pace is slow. Try to read more fluently.",
+        "slow": "Reading pace is slightly slow.",
+        "normal": "Reading pace is appropriate.",
+        "fast": "Good fluent reading pace!",
+        "very_fast": "Very fast reading. Ensure clarity isn't sacrificed for speed."
+    }
+    
     def __init__(
         self, 
         suspicious_wpm_threshold: float = 250,
@@ -91,13 +134,15 @@ class EvaluationService:
         
         # Check for suspicious reading speed
         is_suspicious = self.detect_suspicious_reading(fluency_wpm)
+        speed_category = self.categorize_speed(fluency_wpm)
         
         # Generate performance remarks
         remarks = self.generate_remarks(
             accuracy=accuracy,
             completeness=completeness,
             fluency_wpm=fluency_wpm,
-            is_suspicious=is_suspicious
+            is_suspicious=is_suspicious,
+            speed_category=speed_category
         )
         
         return {
@@ -112,10 +157,100 @@ class EvaluationService:
                 "total_reference_words": total_reference_words,
                 "exact_match_count": len(comparison_result.get('exact_matches', [])),
                 "fuzzy_match_count": len(comparison_result.get('fuzzy_matches', [])),
-                "reading_speed_category": self.categorize_speed(fluency_wpm)
+                "reading_speed_category": speed_category
             }
         }
     
+    def evaluate_batch(
+        self,
+        matched_words: Sequence[int],
+        total_student_words: Sequence[int],
+        total_reference_words: Sequence[int],
+        audio_durations: Sequence[float],
+        word_counts: Sequence[int]
+    ) -> Dict:
+        """
+        Calculate evaluation metrics for many submissions at once.
+        
+        Element i of each argument describes submission i. Metrics are
+        computed with vectorized NumPy operations and match what
+        evaluate() returns for each submission.
+        
+        Args:
+            matched_words: Number of correctly matched words per submission
+            total_student_words: Total words spoken per submission
+            total_reference_words: Total words in the reference per submission
+            audio_durations: Audio durations in seconds
+            word_counts: Number of words spoken per submission
+            
+        Returns:
+            Dictionary containing:
+            - accuracy: Array of accuracy percentages
+            - completeness: Array of completeness percentages
+            - fluency_wpm: Array of words per minute
+            - suspicious: Boolean array of suspicious reading flags
+            - reading_speed_category: List of speed categories
+            - remarks: List of performance feedback messages
+        """
+        matched = np.asarray(matched_words, dtype=np.float64)
+        student_total = np.asarray(total_student_words, dtype=np.float64)
+        reference_total = np.asarray(total_reference_words, dtype=np.float64)
+        durations = np.asarray(audio_durations, dtype=np.float64)
+        words = np.asarray(word_counts, dtype=np.float64)
+        
+        # Percentages are 0 where the denominator is 0, capped at 100%.
+        # Divide before scaling, as the scalar methods do, so values on a
+        # category edge round identically.
+        accuracy = np.minimum(100.0, np.divide(
+            matched, student_total, 
+            out=np.zeros_like(matched), where=student_total != 0
+        ) * 100)
+        completeness = np.minimum(100.0, np.divide(
+            matched, reference_total, 
+            out=np.zeros_like(matched), where=reference_total != 0
+        ) * 100)
+        fluency_wpm = np.divide(
+            words, durations, 
+            out=np.zeros_like(words), where=durations > 0
+        ) * 60
+        
+        suspicious = fluency_wpm > self.suspicious_wpm_threshold
+        
+        # Bin WPM values into speed categories (low <= wpm < high)
+        bins = np.searchsorted(self.SPEED_EDGES, fluency_wpm, side="right")
+        low, high = self.SPEED_BOUNDS
+        valid = (fluency_wpm >= low) & (fluency_wpm < high)  # False for NaN
+        speed_categories = [
+            self.SPEED_LABELS[bin_index] if is_valid else "unknown"
+            for bin_index, is_valid in zip(bins.tolist(), valid.tolist())
+        ]
+        
+        remarks = [
+            self.generate_remarks(
+                accuracy=acc,
+                completeness=comp,
+                fluency_wpm=wpm,
+                is_suspicious=flag,
+                speed_category=category
+            )
+            for acc, comp, wpm, flag, category in zip(
+                accuracy.tolist(), 
+                completeness.tolist(), 
+                fluency_wpm.tolist(), 
+                suspicious.tolist(),
+                speed_categories
+            )
+        ]
+        
+        return {
+            "accuracy": accuracy,
+            "completeness": completeness,
+            "fluency_wpm": fluency_wpm,
+            "suspicious": suspicious,
+            "reading_speed_category": speed_categories,
+            "remarks": remarks
+        }
+    
     def calculate_accuracy(
         self, 
         matched_words: int, 
@@ -218,17 +353,20 @@ class EvaluationService:
         Returns:
             Speed category string
         """
-        for category, (low, high) in self.WPM_RANGES.items():
-            if low <= fluency_wpm < high:
-                return category
-        return "unknown"
+        low, high = self.SPEED_BOUNDS
+        if not low <= fluency_wpm < high:
+            return "unknown"  # Out of range, or NaN
+        
+        # Ranges are contiguous, so the category is found by bisecting the edges
+        return self.SPEED_LABELS[bisect_right(self.SPEED_EDGES, fluency_wpm)]
     
     def generate_remarks(
         self,
         accuracy: float,
         completeness: float,
         fluency_wpm: float,
-        is_suspicious: bool
+        is_suspicious: bool,
+        speed_category: Optional[str] = None
     ) -> str:
         """
         Generate human-readable performance feedback.
@@ -238,6 +376,8 @@ class EvaluationService:
             completeness: Completeness percentage
             fluency_wpm: Words per minute
             is_suspicious: Whether reading speed is suspicious
+            speed_category: Speed category of fluency_wpm, if already known
+                           (computed with categorize_speed() otherwise)
             
         Returns:
             Performance remarks string
@@ -252,37 +392,21 @@ class EvaluationService:
             )
         
         # Accuracy feedback
-        if accuracy >= self.ACCURACY_THRESHOLDS["excellent"]:
-            remarks_parts.append("Excellent accuracy! Words are pronounced correctly.")
-        elif accuracy >= self.ACCURACY_THRESHOLDS["good"]:
-            remarks_parts.append("Good reading performance.")
-        elif accuracy >= self.ACCURACY_THRESHOLDS["average"]:
-            remarks_parts.append("Average performance. Practice pronunciation.")
-        elif accuracy >= self.ACCURACY_THRESHOLDS["needs_improvement"]:
-            remarks_parts.append("Needs improvement. Focus on reading clearly.")
-        else:
-            remarks_parts.append("Significant improvement needed. Practice reading aloud.")
+        remarks_parts.append(
+            self.ACCURACY_REMARKS[bisect_right(self.ACCURACY_EDGES, accuracy)]
+        )
         
         # Completeness feedback
-        if completeness < 50:
-            remarks_parts.append("Only partial text was read.")
-        elif completeness < 80:
-            remarks_parts.append("Most of the text was covered.")
-        else:
-            remarks_parts.append("Good coverage of the reference text.")
+        remarks_parts.append(
+            self.COMPLETENESS_REMARKS[bisect_right(self.COMPLETENESS_EDGES, completeness)]
+        )
         
         # Fluency feedback
-        speed_category = self.categorize_speed(fluency_wpm)
-        if speed_category == "very_slow":
-            remarks_parts.append("Reading pace is slow. Try to read more fluently.")
-        elif speed_category == "slow":
-            remarks_parts.append("Reading pace is slightly slow.")
-        elif speed_category == "normal":
-            remarks_parts.append("Reading pace is appropriate.")
-        elif speed_category == "fast":
-            remarks_parts.append("Good fluent reading pace!")
-        elif speed_category == "very_fast":
-            remarks_parts.append("Very fast reading. Ensure clarity isn't sacrificed for speed.")
+        if speed_category is None:
+            speed_category = self.categorize_speed(fluency_wpm)
+        speed_remark = self.SPEED_REMARKS.get(speed_category)
+        if speed_remark is not None:
+            remarks_parts.append(speed_remark)
         
         return " ".join(remarks_parts)
     
@@ -313,8 +437,7 @@ class EvaluationService:
 
 
 # Singleton instance
-_evaluation_service_instance = None
-
+@cache
 def get_evaluation_service() -> EvaluationService:
     """
     Get singleton instance of EvaluationService.
@@ -322,7 +445,4 @@ def get_evaluation_service() -> EvaluationService:
     Returns:
         EvaluationService instance
     """
-    global _evaluation_service_instance
-    if _evaluation_service_instance is None:
-        _evaluation_service_instance = EvaluationService()
-    return _evaluation_service_instance
+    return EvaluationService()
@@ -10,13 +10,140 @@ This service provides:
 - Word tokenization
 """
 
-import re
 import string
-from typing import List, Dict, Tuple
+import sys
+from collections import Counter, deque
+from functools import cache, lru_cache
+from typing import Final, List, Dict, Optional, Sequence, Tuple, Union
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 from rapidfuzz.distance import Levenshtein
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Translation table mapping punctuation to spaces
+# (keeping apostrophes for contractions)
+_PUNCTUATION_TABLE: Final = str.maketrans(
+    {char: ' ' for char in string.punctuation if char != "'"}
+)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_text(text: str) -> str:
+    """Normalize text (see TextService.normalize), memoized per input string."""
+    # Convert to lowercase and remove punctuation
+    # (keep apostrophes for words like "don't")
+    normalized = text.lower().translate(_PUNCTUATION_TABLE)
+    
+    # Split on whitespace and rejoin: collapses runs of whitespace
+    # into single spaces and strips both ends in one pass
+    return ' '.join(normalized.split())
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_text(text: str) -> Tuple[str, ...]:
+    """Split text into word tokens, memoized per input string."""
+    # Interned tokens share one object per distinct word, so the same word
+    # from different texts compares and hashes by identity
+    return tuple(sys.intern(word) for word in text.split())
+
+
+def _lcs_length(seq1: List[int], seq2: List[int]) -> int:
+    """
+    LCS length of two integer sequences (pure Python fallback).
+    
+    Keeps a single DP row of len(seq2) + 1, updated in place, plus the
+    diagonal value it overwrites, so seq2 should be the shorter sequence.
+    """
+    n = len(seq2)
+    row = [0] * (n + 1)
+    
+    for item in seq1:
+        diagonal = 0  # row[j] of the previous iteration of the outer loop
+        for j in range(n):
+            above = row[j + 1]
+            if item == seq2[j]:
+                row[j + 1] = diagonal + 1
+            elif row[j] > above:
+                row[j + 1] = row[j]
+            diagonal = above
+    
+    return row[n]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _lcs_length_jit(seq1, seq2):
+        """LCS length of two int32 arrays (see _lcs_length), compiled with Numba."""
+        n = seq2.shape[0]
+        row = np.zeros(n + 1, dtype=np.int32)
+        
+        for i in range(seq1.shape[0]):
+            item = seq1[i]
+            diagonal = 0
+            for j in range(n):
+                above = row[j + 1]
+                if item == seq2[j]:
+                    row[j + 1] = diagonal + 1
+                elif row[j] > above:
+                    row[j + 1] = row[j]
+                diagonal = above
+        
+        return row[n]
+
+
+def _greedy_assign(scores: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Assign each row its best column not taken by an earlier row (NumPy fallback).
+    
+    Rows are processed in order; ties go to the first column.
+    
+    Returns:
+        Assigned column per row, or -1 where no score is positive and
+        at least threshold
+    """
+    assignment = np.full(scores.shape[0], -1, dtype=np.int64)
+    scores = scores.copy()
+    
+    for row in range(scores.shape[0]):
+        best_col = int(np.argmax(scores[row]))
+        best_score = scores[row, best_col]
+        
+        if best_score > 0 and best_score >= threshold:
+            assignment[row] = best_col
+            scores[:, best_col] = -1  # Each column can only be used once
+    
+    return assignment
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _greedy_assign_jit(scores, threshold):
+        """Greedy row-to-column assignment (see _greedy_assign), compiled with Numba."""
+        n_rows, n_cols = scores.shape
+        assignment = np.full(n_rows, -1, dtype=np.int64)
+        taken = np.zeros(n_cols, dtype=np.bool_)
+        
+        for row in range(n_rows):
+            best_col = -1
+            best_score = 0.0
+            for col in range(n_cols):
+                if not taken[col] and scores[row, col] > best_score:
+                    best_score = scores[row, col]
+                    best_col = col
+            
+            if best_col >= 0 and best_score >= threshold:
+                assignment[row] = best_col
+                taken[best_col] = True
+        
+        return assignment
+
 
 class TextService:
     """
@@ -26,6 +153,9 @@ class TextService:
     against reference text for reading evaluation.
     """
     
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("fuzzy_threshold",)
+    
     def __init__(self, fuzzy_threshold: int = 80):
         """
         Initialize TextService.
@@ -37,15 +167,8 @@ class TextService:
         """
         self.fuzzy_threshold = fuzzy_threshold
         
-        # Punctuation to remove (keeping apostrophes for contractions)
-        self.punctuation_pattern = re.compile(
-            f"[{re.escape(string.punctuation.replace(chr(39), ''))}]"
-        )
-        
-        # Pattern for multiple whitespaces
-        self.whitespace_pattern = re.compile(r'\s+')
-        
-    def normalize(self, text: str) -> str:
+    @staticmethod
+    def normalize(text: str) -> str:
         """
         Normalize text for comparison.
         
@@ -55,6 +178,9 @@ class TextService:
         3. Replace multiple whitespaces with single space
         4. Strip leading/trailing whitespace
         
+        Results are cached, so texts normalized repeatedly (e.g. the same
+        reference passage for every student) are only processed once.
+        
         Args:
             text: Raw text to normalize
             
@@ -64,21 +190,10 @@ class TextService:
         if not text:
             return ""
         
-        # Convert to lowercase
-        normalized = text.lower()
-        
-        # Remove punctuation (keep apostrophes for words like "don't")
-        normalized = self.punctuation_pattern.sub(' ', normalized)
-        
-        # Replace multiple whitespaces with single space
-        normalized = self.whitespace_pattern.sub(' ', normalized)
-        
-        # Strip leading/trailing whitespace
-        normalized = normalized.strip()
-        
-        return normalized
+        return _normalize_text(text)
     
-    def tokenize(self, text: str) -> List[str]:
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
         """
         Split text into word tokens.
         
@@ -91,16 +206,45 @@ class TextService:
         if not text:
             return []
         
-        # Split by whitespace and filter empty strings
-        tokens = [word for word in text.split() if word]
+        # Split by whitespace (cached; a fresh list is returned each call
+        # so callers can modify it)
+        return list(_tokenize_text(text))
+    
+    @staticmethod
+    def _assign_ids(tokens: Sequence[str], id_map: Dict[str, int]) -> List[int]:
+        """Map tokens to integer IDs, adding unseen words to id_map."""
+        return [id_map.setdefault(word, len(id_map)) for word in tokens]
+    
+    def _prepare(
+        self, 
+        text: str, 
+        id_map: Optional[Dict[str, int]] = None
+    ) -> Tuple[List[str], List[int], Dict[str, int]]:
+        """
+        Tokenize text and assign an integer ID to each token.
+        
+        Texts prepared with the same id_map can be compared by ID,
+        which is much cheaper than comparing strings in the LCS loop.
         
-        return tokens
+        Args:
+            text: Normalized text
+            id_map: Shared word -> ID mapping (created if None)
+            
+        Returns:
+            Tuple of (tokens, token IDs, id_map)
+        """
+        if id_map is None:
+            id_map = {}
+        tokens = self.tokenize(text)
+        return tokens, self._assign_ids(tokens, id_map), id_map
     
     def compare_texts(
         self, 
         student_text: str, 
         reference_text: str,
-        use_fuzzy: bool = True
+        use_fuzzy: bool = True,
+        reference_tokens: Optional[List[str]] = None,
+        include_details: bool = False
     ) -> Dict:
         """
         Compare student text with reference text.
@@ -108,10 +252,18 @@ class TextService:
         Performs word-by-word comparison using exact matching
         and optionally fuzzy matching for words that don't match exactly.
         
+        Exact matches are resolved first. The remaining student words are
+        then scored against all remaining reference words in one batch, and
+        each student word (in reading order) takes its best unused match.
+        
         Args:
             student_text: Normalized student transcription
             reference_text: Normalized reference text
             use_fuzzy: Whether to use fuzzy matching for non-exact matches
+            reference_tokens: Pre-tokenized reference text. If given, it is
+                             used instead of tokenizing reference_text again.
+            include_details: Whether to build the per-word match_details list
+                            (left empty otherwise)
             
         Returns:
             Dictionary containing comparison results:
@@ -123,74 +275,217 @@ class TextService:
             - unmatched_student: Words spoken but not in reference
             - unmatched_reference: Reference words not spoken
             - match_details: Detailed per-word match information
+              (only if include_details is True)
+            - student_ids / reference_ids: Token IDs (from a shared mapping)
+              that can be passed to get_word_order_accuracy()
         """
         # Tokenize both texts
-        student_tokens = self.tokenize(student_text)
-        reference_tokens = self.tokenize(reference_text)
+        if reference_tokens is None:
+            reference_tokens, reference_ids, id_map = self._prepare(reference_text)
+        else:
+            id_map = {}
+            reference_ids = self._assign_ids(reference_tokens, id_map)
+        student_tokens, student_ids, _ = self._prepare(student_text, id_map)
+        
+        # Without fuzzy matching, the comparison is a multiset intersection
+        if not use_fuzzy:
+            result = self._compare_exact(student_tokens, reference_tokens, include_details)
+        else:
+            result = self._compare_tokens(student_tokens, reference_tokens, include_details)
+        
+        return result | {"student_ids": student_ids, "reference_ids": reference_ids}
+    
+    def compare_texts_batch(
+        self,
+        student_texts: List[str],
+        reference_text: str,
+        use_fuzzy: bool = True,
+        reference_tokens: Optional[List[str]] = None,
+        include_details: bool = False
+    ) -> List[Dict]:
+        """
+        Compare many student texts with one reference text.
+        
+        Gives the same results as calling compare_texts() for each student
+        text, but scores every distinct student word against the reference
+        in a single fuzzy matching call (e.g. a whole class reading the
+        same passage).
+        
+        Args:
+            student_texts: Normalized student transcriptions
+            reference_text: Normalized reference text
+            use_fuzzy: Whether to use fuzzy matching for non-exact matches
+            reference_tokens: Pre-tokenized reference text. If given, it is
+                             used instead of tokenizing reference_text again.
+            include_details: Whether to build the per-word match_details lists
+            
+        Returns:
+            List of comparison results (see compare_texts()), one per student text
+        """
+        if reference_tokens is None:
+            reference_tokens, reference_ids, id_map = self._prepare(reference_text)
+        else:
+            id_map = {}
+            reference_ids = self._assign_ids(reference_tokens, id_map)
+        
+        # Each student's words get IDs on top of the reference's, as in compare_texts()
+        prepared = [self._prepare(text, dict(id_map))[:2] for text in student_texts]
+        
+        # Similarity of each distinct student word to every reference word
+        similarity = None
+        word_rows: Dict[str, int] = {}
+        if use_fuzzy:
+            for student_tokens, _ in prepared:
+                for word in student_tokens:
+                    word_rows.setdefault(word, len(word_rows))
+            
+            if word_rows and reference_tokens:
+                similarity = process.cdist(
+                    list(word_rows),
+                    reference_tokens,
+                    scorer=fuzz.ratio,
+                    score_cutoff=min(self.fuzzy_threshold, 100),
+                    dtype=np.float64,
+                    workers=-1
+                )
+        
+        results = []
+        for student_tokens, student_ids in prepared:
+            if not use_fuzzy:
+                result = self._compare_exact(student_tokens, reference_tokens, include_details)
+            else:
+                result = self._compare_tokens(
+                    student_tokens, 
+                    reference_tokens, 
+                    include_details,
+                    similarity=(
+                        similarity[[word_rows[word] for word in student_tokens]]
+                        if similarity is not None else None
+                    )
+                )
+            results.append(
+                result | {"student_ids": student_ids, "reference_ids": reference_ids}
+            )
+        
+        return results
+    
+    def _compare_tokens(
+        self, 
+        student_tokens: List[str], 
+        reference_tokens: List[str],
+        include_details: bool,
+        similarity: Optional[np.ndarray] = None
+    ) -> Dict:
+        """
+        Compare tokens using exact matching, then fuzzy matching.
         
+        Args:
+            student_tokens: Student word tokens
+            reference_tokens: Reference word tokens
+            include_details: Whether to build the per-word match_details list
+            similarity: Optional precomputed fuzzy scores of shape
+                       (len(student_tokens), len(reference_tokens)), with
+                       scores below the threshold set to 0
+            
+        Returns:
+            Comparison results in the same format as compare_texts()
+        """
         # Track results
         matched_words = 0
         exact_matches = []
         fuzzy_matches = []
         unmatched_student = []
-        match_details = []
-        
-        # Create a copy of reference tokens to track coverage
-        reference_remaining = reference_tokens.copy()
         
-        # Process each student word
-        for student_word in student_tokens:
-            match_found = False
-            match_type = None
-            matched_ref_word = None
-            match_score = 0
-            
-            # Try exact matching first
-            if student_word in reference_remaining:
-                match_found = True
-                match_type = "exact"
-                matched_ref_word = student_word
-                match_score = 100
-                reference_remaining.remove(student_word)
+        # Per-word match information, in student word order
+        match_types: List[Optional[str]] = [None] * len(student_tokens)
+        matched_ref_words: List[Optional[str]] = [None] * len(student_tokens)
+        match_scores: List[float] = [0] * len(student_tokens)
+        
+        # Track which reference positions have been matched
+        consumed = [False] * len(reference_tokens)
+        
+        # Positions of each reference word, first occurrence first
+        ref_positions: Dict[str, deque] = {}
+        for pos, ref_word in enumerate(reference_tokens):
+            ref_positions.setdefault(ref_word, deque()).append(pos)
+        
+        # Exact matching pass (O(1) lookup per word)
+        unmatched_indices = []
+        for idx, student_word in enumerate(student_tokens):
+            positions = ref_positions.get(student_word)
+            if positions:
+                match_types[idx] = "exact"
+                matched_ref_words[idx] = student_word
+                match_scores[idx] = 100
+                consumed[positions.popleft()] = True
                 exact_matches.append(student_word)
                 matched_words += 1
+            else:
+                unmatched_indices.append(idx)
+        
+        # Reference positions still available, in reference order
+        remaining_positions = [
+            pos for pos, is_consumed in enumerate(consumed) if not is_consumed
+        ]
+        reference_remaining = [reference_tokens[pos] for pos in remaining_positions]
+        
+        # Fuzzy matching pass over the words left unmatched
+        if unmatched_indices and reference_remaining:
+            if similarity is not None:
+                scores = similarity[np.ix_(unmatched_indices, remaining_positions)]
+            else:
+                # Similarity of every (student, reference) pair in one native call;
+                # scores below the threshold come back as 0
+                scores = process.cdist(
+                    [student_tokens[idx] for idx in unmatched_indices],
+                    reference_remaining,
+                    scorer=fuzz.ratio,
+                    score_cutoff=min(self.fuzzy_threshold, 100),
+                    dtype=np.float64,
+                    workers=-1
+                )
+            
+            # Greedily give each student word its best remaining reference word,
+            # accepting matches above threshold
+            assign = _greedy_assign_jit if NUMBA_AVAILABLE else _greedy_assign
+            assignment = assign(scores, float(self.fuzzy_threshold)).tolist()
+            
+            for row, idx in enumerate(unmatched_indices):
+                best_idx = assignment[row]
+                if best_idx < 0:
+                    continue
                 
-            # Try fuzzy matching if exact match not found
-            elif use_fuzzy:
-                best_match = None
-                best_score = 0
-                best_idx = -1
-                
-                # Find best fuzzy match in remaining reference words
-                for idx, ref_word in enumerate(reference_remaining):
-                    score = fuzz.ratio(student_word, ref_word)
-                    if score > best_score:
-                        best_score = score
-                        best_match = ref_word
-                        best_idx = idx
+                best_match = reference_remaining[best_idx]
+                best_score = float(scores[row, best_idx])
+                match_types[idx] = "fuzzy"
+                matched_ref_words[idx] = best_match
+                match_scores[idx] = best_score
+                fuzzy_matches.append((student_tokens[idx], best_match, best_score))
+                matched_words += 1
                 
-                # Accept match if above threshold
-                if best_score >= self.fuzzy_threshold:
-                    match_found = True
-                    match_type = "fuzzy"
-                    matched_ref_word = best_match
-                    match_score = best_score
-                    reference_remaining.pop(best_idx)
-                    fuzzy_matches.append((student_word, best_match, best_score))
-                    matched_words += 1
+                # Each reference word can only be matched once
+                consumed[remaining_positions[best_idx]] = True
             
-            # Track unmatched words
+            reference_remaining = [
+                reference_tokens[pos] for pos in remaining_positions 
+                if not consumed[pos]
+            ]
+        
+        # Track unmatched words and record match details
+        match_details = []
+        for idx, student_word in enumerate(student_tokens):
+            match_found = match_types[idx] is not None
             if not match_found:
                 unmatched_student.append(student_word)
             
-            # Record match details
-            match_details.append({
-                "student_word": student_word,
-                "matched": match_found,
-                "match_type": match_type,
-                "reference_word": matched_ref_word,
-                "score": match_score
-            })
+            if include_details:
+                match_details.append({
+                    "student_word": student_word,
+                    "matched": match_found,
+                    "match_type": match_types[idx],
+                    "reference_word": matched_ref_words[idx],
+                    "score": match_scores[idx]
+                })
         
         return {
             "matched_words": matched_words,
@@ -203,7 +498,77 @@ class TextService:
             "match_details": match_details
         }
     
-    def calculate_similarity(self, text1: str, text2: str) -> float:
+    def _compare_exact(
+        self, 
+        student_tokens: List[str], 
+        reference_tokens: List[str],
+        include_details: bool
+    ) -> Dict:
+        """
+        Compare tokens using exact matching only.
+        
+        Matched word counts come from intersecting the word multisets;
+        the token lists are then walked once each to split matched from
+        unmatched words (earliest occurrences match first).
+        
+        Args:
+            student_tokens: Student word tokens
+            reference_tokens: Reference word tokens
+            include_details: Whether to build the per-word match_details list
+            
+        Returns:
+            Comparison results in the same format as compare_texts()
+        """
+        matched_counts = Counter(student_tokens) & Counter(reference_tokens)
+        
+        # Split student words into matched and unmatched
+        exact_matches = []
+        unmatched_student = []
+        match_details = []
+        remaining = matched_counts.copy()
+        for student_word in student_tokens:
+            match_found = remaining[student_word] > 0
+            if match_found:
+                remaining[student_word] -= 1
+                exact_matches.append(student_word)
+            else:
+                unmatched_student.append(student_word)
+            
+            if include_details:
+                match_details.append({
+                    "student_word": student_word,
+                    "matched": match_found,
+                    "match_type": "exact" if match_found else None,
+                    "reference_word": student_word if match_found else None,
+                    "score": 100 if match_found else 0
+                })
+        
+        # Reference words left over once the matched occurrences are used up
+        unmatched_reference = []
+        remaining = matched_counts.copy()
+        for ref_word in reference_tokens:
+            if remaining[ref_word] > 0:
+                remaining[ref_word] -= 1
+            else:
+                unmatched_reference.append(ref_word)
+        
+        return {
+            "matched_words": len(exact_matches),
+            "total_student_words": len(student_tokens),
+            "total_reference_words": len(reference_tokens),
+            "exact_matches": exact_matches,
+            "fuzzy_matches": [],
+            "unmatched_student": unmatched_student,
+            "unmatched_reference": unmatched_reference,
+            "match_details": match_details
+        }
+    
+    def calculate_similarity(
+        self, 
+        text1: str, 
+        text2: str,
+        score_cutoff: Optional[float] = None
+    ) -> float:
         """
         Calculate overall similarity between two texts.
         
@@ -212,6 +577,8 @@ class TextService:
         Args:
             text1: First text
             text2: Second text
+            score_cutoff: Optional minimum score of interest. RapidFuzz stops
+                         early and returns 0 once the score can't reach it.
             
         Returns:
             Similarity score (0-100)
@@ -219,9 +586,14 @@ class TextService:
         if not text1 or not text2:
             return 0.0
         
-        return fuzz.ratio(text1, text2)
+        return fuzz.ratio(text1, text2, score_cutoff=score_cutoff)
     
-    def get_levenshtein_distance(self, word1: str, word2: str) -> int:
+    def get_levenshtein_distance(
+        self, 
+        word1: str, 
+        word2: str,
+        max_distance: Optional[int] = None
+    ) -> int:
         """
         Calculate Levenshtein edit distance between two words.
         
@@ -230,17 +602,19 @@ class TextService:
         Args:
             word1: First word
             word2: Second word
+            max_distance: Optional largest distance of interest. RapidFuzz stops
+                         early and returns max_distance + 1 once it is exceeded.
             
         Returns:
             Number of edits (insertions, deletions, substitutions)
             required to transform word1 into word2
         """
-        return Levenshtein.distance(word1, word2)
+        return Levenshtein.distance(word1, word2, score_cutoff=max_distance)
     
     def get_word_order_accuracy(
         self, 
-        student_tokens: List[str], 
-        reference_tokens: List[str]
+        student_tokens: Union[Sequence[str], Sequence[int]], 
+        reference_tokens: Union[Sequence[str], Sequence[int]]
     ) -> float:
         """
         Calculate how well the student maintained word order.
@@ -248,13 +622,14 @@ class TextService:
         Uses longest common subsequence to measure order preservation.
         
         Args:
-            student_tokens: List of student word tokens
-            reference_tokens: List of reference word tokens
+            student_tokens: Student word tokens, or their IDs
+            reference_tokens: Reference word tokens, or their IDs
+                             (e.g. student_ids/reference_ids from compare_texts())
             
         Returns:
             Order accuracy percentage (0-100)
         """
-        if not student_tokens or not reference_tokens:
+        if len(student_tokens) == 0 or len(reference_tokens) == 0:
             return 0.0
         
         # Calculate LCS length
@@ -272,13 +647,16 @@ class TextService:
     
     def _longest_common_subsequence(
         self, 
-        seq1: List[str], 
-        seq2: List[str]
+        seq1: Union[Sequence[str], Sequence[int]], 
+        seq2: Union[Sequence[str], Sequence[int]]
     ) -> int:
         """
         Calculate length of longest common subsequence.
         
-        Dynamic programming approach for finding LCS.
+        Dynamic programming approach for finding LCS. Words are mapped to
+        integer IDs first (unless IDs are given), and only one row of the
+        DP table is kept, in a contiguous buffer.
+        Uses a Numba-compiled kernel when numba is installed.
         
         Args:
             seq1: First sequence
@@ -287,36 +665,46 @@ class TextService:
         Returns:
             Length of LCS
         """
-        m, n = len(seq1), len(seq2)
-        
-        # Create DP table
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        # Fill the table
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if seq1[i - 1] == seq2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                else:
-                    dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-        
-        return dp[m][n]
+        # Keep the shorter sequence as the DP row
+        if len(seq1) < len(seq2):
+            seq1, seq2 = seq2, seq1
+        
+        # Assign an integer ID to each distinct word
+        if any(len(seq) and isinstance(seq[0], str) for seq in (seq1, seq2)):
+            id_map: Dict[str, int] = {}
+            ids1 = self._assign_ids(seq1, id_map)
+            ids2 = self._assign_ids(seq2, id_map)
+        else:
+            ids1, ids2 = seq1, seq2
+        
+        if NUMBA_AVAILABLE:
+            return int(_lcs_length_jit(
+                np.asarray(ids1, dtype=np.int32), 
+                np.asarray(ids2, dtype=np.int32)
+            ))
+        return _lcs_length(ids1, ids2)
+
 
+# Singleton instance, cached per fuzzy threshold (TextService holds no
+# per-request state, so sharing an instance between callers is safe)
+@cache
+def _text_service_for(fuzzy_threshold: int) -> TextService:
+    """Build the shared TextService for one threshold value."""
+    return TextService(fuzzy_threshold)
 
-# Singleton instance
-_text_service_instance = None
 
 def get_text_service(fuzzy_threshold: int = 80) -> TextService:
     """
     Get singleton instance of TextService.
     
+    There is one instance per threshold value, however it is passed.
+    
     Args:
         fuzzy_threshold: Minimum similarity for fuzzy matching
         
     Returns:
         TextService instance
     """
-    global _text_service_instance
-    if _text_service_instance is None:
-        _text_service_instance = TextService(fuzzy_threshold)
-    return _text_service_instance
+    # Call the cache positionally, so get_text_service(), (80) and
+    # (fuzzy_threshold=80) all share one cache entry
+    return _text_service_for(fuzzy_threshold)
@@ -10,261 +10,1089 @@ Supports:
 - Audio validation
 """
 
+import atexit
+import io
+import json
+import logging
+import mmap
+import multiprocessing
 import os
+import queue
+import shutil
+import struct
+import subprocess
+import sys
 import tempfile
-from typing import Optional
-from pathlib import Path
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from types import ModuleType
 
+import numpy as np
 from pydub import AudioSegment
 import soundfile as sf
 
+try:
+    from mutagen import File as MutagenFile
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
 
-class AudioProcessor:
+try:
+    import soxr
+    SOXR_AVAILABLE = True
+except ImportError:
+    SOXR_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# FFmpeg/FFprobe executables, resolved to absolute paths once at import so
+# subprocess calls skip the PATH search (None if not installed).
+# FFMPEG_BINARY / FFPROBE_BINARY select a specific build.
+FFMPEG_BIN = shutil.which(os.getenv("FFMPEG_BINARY", "ffmpeg"))
+FFPROBE_BIN = shutil.which(os.getenv("FFPROBE_BINARY", "ffprobe"))
+
+# Point pydub's remaining conversions at the same executable
+if FFMPEG_BIN is not None:
+    AudioSegment.converter = FFMPEG_BIN
+
+# Supported input formats
+SUPPORTED_FORMATS = frozenset({'.wav', '.mp3'})
+
+# Target format for Whisper (WAV with specific parameters)
+TARGET_FORMAT = 'wav'
+TARGET_SAMPLE_RATE = 16000  # 16kHz recommended for Whisper
+TARGET_CHANNELS = 1  # Mono audio
+TARGET_SAMPLE_WIDTH = 2  # 16-bit PCM
+
+
+def _ext(audio_path: str) -> str:
+    """Lower-case file extension of a path (e.g. '.wav')."""
+    return os.path.splitext(audio_path)[1].lower()
+
+
+# pydub loader for each supported format
+_LOADERS: Dict[str, Callable[[str], AudioSegment]] = {
+    '.wav': AudioSegment.from_wav,
+    '.mp3': AudioSegment.from_mp3,
+}
+
+# Bytes per sample for the libsndfile subtypes we expect in WAV files
+_SUBTYPE_WIDTHS = {
+    "PCM_U8": 1,
+    "PCM_S8": 1,
+    "PCM_16": 2,
+    "PCM_24": 3,
+    "PCM_32": 4,
+    "FLOAT": 4,
+    "DOUBLE": 8,
+}
+
+
+class _BufferPool:
     """
-    Utility class for processing audio files.
+    Pool of reusable byte buffers for decoded audio.
     
-    Handles audio format conversion and validation for
-    speech recognition compatibility.
+    Buffers are bucketed by power-of-two size, so a buffer returned by
+    one request can be handed to the next one of similar length instead
+    of allocating a fresh multi-megabyte block per upload.
+    
+    Buffers larger than max_buffer_bytes are allocated at their exact
+    size and never pooled, and the pool keeps at most max_total_bytes
+    in total, so a few large uploads can't pin memory for good.
     """
     
-    # Supported input formats
-    SUPPORTED_FORMATS = ['.wav', '.mp3']
+    def __init__(
+        self,
+        max_per_bucket: int = 4,
+        max_buffer_bytes: int = 32 * 1024 * 1024,
+        max_total_bytes: int = 128 * 1024 * 1024
+    ):
+        self.max_per_bucket = max_per_bucket
+        self.max_buffer_bytes = max_buffer_bytes
+        self.max_total_bytes = max_total_bytes
+        self._buckets = {}
+        self._pooled_bytes = 0
+        self._lock = threading.Lock()
     
-    # Target format for Whisper (WAV with specific parameters)
-    TARGET_FORMAT = 'wav'
-    TARGET_SAMPLE_RATE = 16000  # 16kHz recommended for Whisper
-    TARGET_CHANNELS = 1  # Mono audio
+    def _bucket(self, size: int) -> queue.LifoQueue:
+        # setdefault is atomic, so concurrent callers share one queue
+        return self._buckets.setdefault(size, queue.LifoQueue(self.max_per_bucket))
     
-    def __init__(self):
-        """Initialize AudioProcessor."""
-        pass
+    @property
+    def pooled_bytes(self) -> int:
+        """Total size of the buffers currently held by the pool."""
+        return self._pooled_bytes
     
-    def process_audio(self, audio_path: str) -> str:
-        """
-        Process audio file for speech recognition.
+    def get(self, nbytes: int) -> bytearray:
+        """Get a buffer of at least nbytes, reusing a pooled one if possible."""
+        size = 1 << max(nbytes - 1, 0).bit_length()
+        if size > self.max_buffer_bytes:
+            # Too large to pool - don't round it up either
+            return bytearray(nbytes)
         
-        Converts audio to WAV format with:
-        - 16kHz sample rate
-        - Mono channel
-        - 16-bit PCM encoding
+        try:
+            buf = self._bucket(size).get_nowait()
+        except queue.Empty:
+            return bytearray(size)
         
-        Args:
-            audio_path: Path to input audio file
+        with self._lock:
+            self._pooled_bytes -= size
+        return buf
+    
+    def put(self, buf: bytearray):
+        """Return a buffer to the pool (dropped if too large or the pool is full)."""
+        size = len(buf)
+        if size > self.max_buffer_bytes or size & (size - 1):
+            # Oversized buffers (and any not sized by get()) are just freed
+            return
+        
+        with self._lock:
+            if self._pooled_bytes + size > self.max_total_bytes:
+                return
+            try:
+                self._bucket(size).put_nowait(buf)
+            except queue.Full:
+                return
+            self._pooled_bytes += size
+
+
+_buffer_pool = _BufferPool()
+
+# Worker processes for batch jobs, created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool, starting it on first use.
+    
+    Workers are spawned rather than forked: the server process already
+    runs threads (ASR executor, threadpool, module locks), and forking
+    a threaded process can deadlock the child.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(_shutdown_process_pool)
+        return _process_pool
+
+
+def _shutdown_process_pool():
+    """Stop the worker processes, dropping batch jobs that haven't started."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=True, cancel_futures=True)
+            _process_pool = None
+
+
+# WAV format tags for integer PCM, IEEE float and WAVE_FORMAT_EXTENSIBLE
+_WAV_PCM = 1
+_WAV_FLOAT = 3
+_WAV_EXTENSIBLE = 0xFFFE
+
+
+def _wav_header_probe(audio_path: str, size: int) -> Optional[dict]:
+    """
+    Read WAV duration and format by walking the RIFF chunks in place.
+    
+    The file is memory-mapped, so only the pages holding the chunk
+    headers are touched and nothing is copied.
+    
+    Args:
+        audio_path: Path to a .wav file
+        size: File size in bytes
+        
+    Returns:
+        Dictionary like _probe(), or None for files that aren't plain
+        PCM or float WAV (left to soundfile)
+    """
+    if size < 44:
+        return None
+    
+    fmt = None
+    data_size = None
+    with open(audio_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:4] != b'RIFF' or mm[8:12] != b'WAVE':
+            return None
+        
+        position = 12
+        while position + 8 <= size:
+            chunk_id = mm[position:position + 4]
+            chunk_size, = struct.unpack_from('<I', mm, position + 4)
+            body = position + 8
             
-        Returns:
-            Path to processed audio file (may be same as input if already compatible)
+            if chunk_id == b'fmt ' and chunk_size >= 16 and body + chunk_size <= size:
+                fmt = struct.unpack_from('<HHIIHH', mm, body)
+                if fmt[0] == _WAV_EXTENSIBLE and chunk_size >= 40:
+                    # The real format tag leads the SubFormat GUID
+                    format_tag, = struct.unpack_from('<H', mm, body + 24)
+                    fmt = (format_tag,) + fmt[1:]
+            elif chunk_id == b'data':
+                # Streamed files may leave the size unset or too large
+                data_size = min(chunk_size, size - body)
+                break
             
-        Raises:
-            FileNotFoundError: If audio file doesn't exist
-            ValueError: If audio format is not supported
-        """
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
-        
-        # Get file extension
-        file_ext = Path(audio_path).suffix.lower()
-        
-        if file_ext not in self.SUPPORTED_FORMATS:
-            raise ValueError(
-                f"Unsupported audio format: {file_ext}. "
-                f"Supported formats: {self.SUPPORTED_FORMATS}"
+            # Chunks are padded to an even length
+            position = body + chunk_size + (chunk_size & 1)
+    
+    if fmt is None or data_size is None:
+        return None
+    
+    format_tag, channels, sample_rate, _, block_align, bits = fmt
+    if format_tag not in (_WAV_PCM, _WAV_FLOAT) or not (channels and sample_rate and block_align):
+        return None
+    
+    return {
+        "duration": data_size // block_align / sample_rate,
+        "sample_rate": sample_rate,
+        "channels": channels,
+        "sample_width": bits // 8 or None,
+    }
+
+
+# MPEG audio Layer III frame header tables, indexed by the version bits
+# (0 = MPEG 2.5, 2 = MPEG 2, 3 = MPEG 1) and then the header field
+_MP3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    0: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+
+def _mp3_header_probe(audio_path: str, size: int) -> Optional[dict]:
+    """
+    Read MP3 duration from the first frame header.
+    
+    VBR files are timed from the frame count in their Xing/Info or
+    VBRI header; constant-bitrate files without one from the file
+    size and bitrate. Only the start of the file and the ID3v1 tag
+    position are read.
+    
+    Args:
+        audio_path: Path to a .mp3 file
+        size: File size in bytes
+        
+    Returns:
+        Dictionary like _probe(), or None if the header can't be used
+    """
+    with open(audio_path, 'rb') as f:
+        data = f.read(65536)
+        
+        # Skip an ID3v2 tag (its size is a 28-bit syncsafe integer)
+        start = 0
+        if data[:3] == b'ID3' and len(data) >= 10:
+            start = 10 + (
+                (data[6] & 0x7f) << 21 | (data[7] & 0x7f) << 14 |
+                (data[8] & 0x7f) << 7 | (data[9] & 0x7f)
             )
+            if data[5] & 0x10:
+                start += 10  # Footer
+            f.seek(start)
+            data = f.read(65536)
+        
+        if size >= 128:
+            f.seek(size - 128)
+            has_id3v1 = f.read(3) == b'TAG'
+        else:
+            has_id3v1 = False
+    
+    # Find the first valid Layer III frame header that is followed by
+    # another frame sync, so stray 0xFF bytes aren't mistaken for one
+    offset = data.find(b'\xff')
+    while 0 <= offset <= len(data) - 4:
+        header, = struct.unpack_from('>I', data, offset)
+        version = (header >> 19) & 3
+        layer = (header >> 17) & 3
+        bitrate_index = (header >> 12) & 15
+        rate_index = (header >> 10) & 3
+        if (
+            header >> 21 == 0x7ff and version != 1 and layer == 1 and
+            0 < bitrate_index < 15 and rate_index < 3
+        ):
+            sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+            bitrate = _MP3_BITRATES[version][bitrate_index] * 1000
+            samples_per_frame = 1152 if version == 3 else 576
+            padding = (header >> 9) & 1
+            next_frame = offset + samples_per_frame // 8 * bitrate // sample_rate + padding
+            if next_frame + 2 > len(data) or (
+                data[next_frame] == 0xff and data[next_frame + 1] & 0xe0 == 0xe0
+            ):
+                break
+        offset = data.find(b'\xff', offset + 1)
+    else:
+        return None
+    
+    channels = 1 if (header >> 6) & 3 == 3 else 2
+    
+    # A Xing/Info tag sits after the side info, a VBRI tag at byte 36
+    if version == 3:
+        side_info = 17 if channels == 1 else 32
+    else:
+        side_info = 9 if channels == 1 else 17
+    xing = offset + 4 + side_info
+    frames = None
+    try:
+        if data[xing:xing + 4] in (b'Xing', b'Info'):
+            flags, = struct.unpack_from('>I', data, xing + 4)
+            if not flags & 1:
+                # VBR tag without a frame count - leave it to the other probes
+                return None
+            frames, = struct.unpack_from('>I', data, xing + 8)
+        elif data[offset + 36:offset + 40] == b'VBRI':
+            frames, = struct.unpack_from('>I', data, offset + 50)
+    except struct.error:
+        # Truncated tag
+        return None
+    
+    if frames is not None:
+        duration = frames * samples_per_frame / sample_rate
+    else:
+        audio_bytes = size - start - offset - (128 if has_id3v1 else 0)
+        duration = audio_bytes * 8 / bitrate
+    
+    return {
+        "duration": duration,
+        "sample_rate": sample_rate,
+        "channels": channels,
+        "sample_width": None,
+    }
+
+
+@lru_cache(maxsize=256)
+def _probe(audio_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Read duration and stream properties of an audio file.
+    
+    Cached on (path, mtime, size) so validating an upload and then
+    asking for its duration or info parses the file only once; a
+    rewritten file gets a new key.
+    
+    Args:
+        audio_path: Absolute path to audio file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        Dictionary with duration, sample_rate, channels and sample_width
+        (sample_width may be None for compressed formats)
+        
+    Raises:
+        Exception: If the file cannot be parsed
+    """
+    file_ext = _ext(audio_path)
+    
+    if file_ext == '.wav':
+        metadata = _wav_header_probe(audio_path, size)
+        if metadata is not None:
+            return metadata
         
-        # Load audio using pydub
         try:
-            if file_ext == '.mp3':
-                audio = AudioSegment.from_mp3(audio_path)
-            elif file_ext == '.wav':
-                audio = AudioSegment.from_wav(audio_path)
-            else:
-                audio = AudioSegment.from_file(audio_path)
-        except Exception as e:
-            raise ValueError(f"Failed to load audio file: {str(e)}")
-        
-        # Check if conversion is needed
-        needs_conversion = (
-            audio.frame_rate != self.TARGET_SAMPLE_RATE or
-            audio.channels != self.TARGET_CHANNELS or
-            file_ext != '.wav'
+            info = sf.info(audio_path)
+            return {
+                "duration": info.duration,
+                "sample_rate": info.samplerate,
+                "channels": info.channels,
+                "sample_width": _SUBTYPE_WIDTHS.get(info.subtype),
+            }
+        except RuntimeError:
+            # libsndfile cannot read this WAV variant; try the other probes
+            pass
+    
+    elif MUTAGEN_AVAILABLE:
+        # mutagen reads MP3 frame headers in-process, without a subprocess
+        try:
+            tags = MutagenFile(audio_path)
+        except Exception:
+            tags = None
+        if tags is not None and tags.info.length:
+            return {
+                "duration": tags.info.length,
+                "sample_rate": tags.info.sample_rate,
+                "channels": tags.info.channels,
+                "sample_width": None,
+            }
+    
+    if file_ext == '.mp3':
+        # Without mutagen, the first frame header is usually enough
+        metadata = _mp3_header_probe(audio_path, size)
+        if metadata is not None:
+            return metadata
+    
+    if FFPROBE_BIN is not None:
+        # ffprobe reads only the container and stream headers
+        result = subprocess.run(
+            [
+                FFPROBE_BIN, '-v', 'quiet',
+                '-print_format', 'json',
+                '-show_streams', '-show_format',
+                audio_path
+            ],
+            check=True,
+            capture_output=True
         )
+        data = json.loads(result.stdout)
+        stream = next(s for s in data["streams"] if s.get("codec_type") == "audio")
+        bits = int(stream.get("bits_per_sample") or 0)
+        return {
+            "duration": float(data["format"]["duration"]),
+            "sample_rate": int(stream["sample_rate"]),
+            "channels": int(stream["channels"]),
+            "sample_width": bits // 8 or None,
+        }
+    
+    # Fallback: decode using pydub
+    loader = _LOADERS.get(_ext(audio_path), AudioSegment.from_file)
+    audio = loader(audio_path)
+    return {
+        "duration": get_duration_from_segment(audio),
+        "sample_rate": audio.frame_rate,
+        "channels": audio.channels,
+        "sample_width": audio.sample_width,
+    }
+
+
+def process_audio(audio_path: str) -> str:
+    """
+    Process audio file for speech recognition.
+    
+    Converts audio to WAV format with:
+    - 16kHz sample rate
+    - Mono channel
+    - 16-bit PCM encoding
+    
+    Args:
+        audio_path: Path to input audio file
+        
+    Returns:
+        Path to processed audio file (may be same as input if already compatible)
         
-        if not needs_conversion:
-            return audio_path
+    Raises:
+        FileNotFoundError: If audio file doesn't exist
+        ValueError: If audio format is not supported
+    """
+    if not os.path.exists(audio_path):
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    
+    # Get file extension
+    file_ext = _ext(audio_path)
+    
+    if file_ext not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported audio format: {file_ext}. "
+            f"Supported formats: {', '.join(sorted(SUPPORTED_FORMATS))}"
+        )
+    
+    # Fast path: WAV already in target format needs no decoding at all
+    if file_ext == '.wav' and _is_target_wav(audio_path):
+        return audio_path
+    
+    # Decode and convert in a single ffmpeg run when it is available
+    if FFMPEG_BIN is not None:
+        return _ffmpeg_convert(audio_path)
+    
+    # Fallback: load audio using pydub
+    try:
+        audio = _LOADERS[file_ext](audio_path)
+    except Exception as e:
+        raise ValueError(f"Failed to load audio file: {str(e)}")
+    
+    # Check if conversion is needed
+    needs_conversion = (
+        audio.frame_rate != TARGET_SAMPLE_RATE or
+        audio.channels != TARGET_CHANNELS or
+        file_ext != '.wav'
+    )
+    
+    if not needs_conversion:
+        return audio_path
+    
+    # Convert audio
+    samples = _convert_audio(audio)
+    
+    # Save to temporary file
+    temp_file = tempfile.NamedTemporaryFile(
+        delete=False,
+        suffix='.wav'
+    )
+    temp_path = temp_file.name
+    temp_file.close()
+    
+    sf.write(temp_path, samples, TARGET_SAMPLE_RATE, subtype='PCM_16')
+    
+    return temp_path
+
+
+def process_audio_to_bytes(audio_path: str) -> bytes:
+    """
+    Process audio file for speech recognition, returning WAV bytes.
+    
+    Same conversion as process_audio(), but the 16kHz mono 16-bit WAV
+    is returned in memory (wrap it in io.BytesIO for file-like readers),
+    so no temporary file is written and read back.
+    
+    Args:
+        audio_path: Path to input audio file
         
-        # Convert audio
-        processed_audio = self._convert_audio(audio)
+    Returns:
+        Contents of the processed WAV file
         
-        # Save to temporary file
-        temp_file = tempfile.NamedTemporaryFile(
-            delete=False,
-            suffix='.wav'
+    Raises:
+        FileNotFoundError: If audio file doesn't exist
+        ValueError: If audio format is not supported
+    """
+    if not os.path.exists(audio_path):
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    
+    file_ext = _ext(audio_path)
+    
+    if file_ext not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported audio format: {file_ext}. "
+            f"Supported formats: {', '.join(sorted(SUPPORTED_FORMATS))}"
         )
-        temp_path = temp_file.name
-        temp_file.close()
-        
-        processed_audio.export(
-            temp_path,
-            format='wav',
-            parameters=[
-                '-ar', str(self.TARGET_SAMPLE_RATE),
-                '-ac', str(self.TARGET_CHANNELS)
-            ]
+    
+    # Fast path: WAV already in target format is returned as-is
+    if file_ext == '.wav' and _is_target_wav(audio_path):
+        with open(audio_path, 'rb') as f:
+            return f.read()
+    
+    if FFMPEG_BIN is not None:
+        buf, length = _ffmpeg_pipe(
+            audio_path,
+            ['-acodec', 'pcm_s16le', '-f', 'wav'],
+            TARGET_SAMPLE_WIDTH
         )
+        try:
+            _fix_wav_sizes(buf, length)
+            return bytes(memoryview(buf)[:length])
+        finally:
+            _buffer_pool.put(buf)
+    
+    # Fallback: load audio using pydub
+    try:
+        audio = _LOADERS[file_ext](audio_path)
+    except Exception as e:
+        raise ValueError(f"Failed to load audio file: {str(e)}")
+    
+    output = io.BytesIO()
+    sf.write(output, _convert_audio(audio), TARGET_SAMPLE_RATE, subtype='PCM_16', format='WAV')
+    return output.getvalue()
+
+
+def _fix_wav_sizes(buf: bytearray, length: int):
+    """
+    Fill in the RIFF and data chunk sizes of a WAV written to a pipe.
+    
+    ffmpeg can't seek back on stdout, so it leaves both sizes unset.
+    
+    Args:
+        buf: Buffer holding the WAV file
+        length: Number of valid bytes in buf
+    """
+    struct.pack_into('<I', buf, 4, length - 8)
+    
+    position = 12
+    while position + 8 <= length:
+        body = position + 8
+        if buf[position:position + 4] == b'data':
+            struct.pack_into('<I', buf, position + 4, length - body)
+            return
+        chunk_size, = struct.unpack_from('<I', buf, position + 4)
+        position = body + chunk_size + (chunk_size & 1)
+
+
+def _ffmpeg_convert(audio_path: str) -> str:
+    """
+    Convert an audio file to 16kHz mono 16-bit PCM WAV with ffmpeg.
+    
+    Args:
+        audio_path: Path to input audio file
+        
+    Returns:
+        Path to a new temporary WAV file
         
-        return temp_path
+    Raises:
+        ValueError: If ffmpeg fails to convert the file
+    """
+    temp_file = tempfile.NamedTemporaryFile(
+        delete=False,
+        suffix='.wav'
+    )
+    temp_path = temp_file.name
+    temp_file.close()
+    
+    try:
+        subprocess.run(
+            [
+                FFMPEG_BIN, '-v', 'error', '-y',
+                '-i', audio_path,
+                '-ar', str(TARGET_SAMPLE_RATE),
+                '-ac', str(TARGET_CHANNELS),
+                '-acodec', 'pcm_s16le',
+                '-f', 'wav',
+                temp_path
+            ],
+            check=True,
+            capture_output=True
+        )
+    except subprocess.CalledProcessError as e:
+        os.unlink(temp_path)
+        error = e.stderr.decode(errors='replace').strip()
+        raise ValueError(f"Failed to convert audio file: {error}")
+    
+    return temp_path
+
+
+def decode_to_array(audio_path: str) -> np.ndarray:
+    """
+    Decode an audio file into a waveform ready for speech recognition.
+    
+    Decodes once, straight into memory, so the result can be handed
+    to Whisper without writing and re-reading an intermediate WAV.
     
-    def _convert_audio(self, audio: AudioSegment) -> AudioSegment:
-        """
-        Convert audio to target specifications.
+    Args:
+        audio_path: Path to input audio file
         
-        Args:
-            audio: Pydub AudioSegment
-            
-        Returns:
-            Converted AudioSegment
-        """
-        # Convert to mono if stereo
-        if audio.channels > 1:
-            audio = audio.set_channels(self.TARGET_CHANNELS)
+    Returns:
+        1-D float32 array of 16kHz mono samples in [-1, 1]
+        
+    Raises:
+        FileNotFoundError: If audio file doesn't exist
+        ValueError: If audio format is not supported or decoding fails
+    """
+    if not os.path.exists(audio_path):
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    
+    file_ext = _ext(audio_path)
+    
+    if file_ext not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported audio format: {file_ext}. "
+            f"Supported formats: {', '.join(sorted(SUPPORTED_FORMATS))}"
+        )
+    
+    # Fast path: WAV already in target format is read directly
+    if file_ext == '.wav' and _is_target_wav(audio_path):
+        samples, _ = sf.read(audio_path, dtype='float32')
+        return samples
+    
+    # Let ffmpeg decode, downmix and resample straight to float32 on stdout
+    if FFMPEG_BIN is not None:
+        return _ffmpeg_decode(audio_path)
+    
+    # Fallback: decode using pydub
+    try:
+        audio = _LOADERS[file_ext](audio_path)
+    except Exception as e:
+        raise ValueError(f"Failed to load audio file: {str(e)}")
+    
+    return _convert_audio(audio)
+
+
+def _ffmpeg_decode(audio_path: str) -> np.ndarray:
+    """
+    Decode an audio file to a 16kHz mono float32 waveform with ffmpeg.
+    
+    Raw samples are read from ffmpeg's stdout into a pooled buffer,
+    so no intermediate file is written. Pass the result to release()
+    once it is no longer used to recycle the buffer.
+    
+    Args:
+        audio_path: Path to input audio file
         
-        # Resample to target sample rate
-        if audio.frame_rate != self.TARGET_SAMPLE_RATE:
-            audio = audio.set_frame_rate(self.TARGET_SAMPLE_RATE)
+    Returns:
+        1-D float32 array of 16kHz mono samples in [-1, 1]
         
-        return audio
+    Raises:
+        ValueError: If ffmpeg fails to decode the file
+    """
+    buf, length = _ffmpeg_pipe(audio_path, ['-f', 'f32le'], 4)
+    return np.frombuffer(buf, dtype=np.float32, count=length // 4)
+
+
+def _ffmpeg_pipe(
+    audio_path: str,
+    output_args: List[str],
+    bytes_per_sample: int
+) -> Tuple[bytearray, int]:
+    """
+    Run ffmpeg to 16kHz mono output on stdout, reading it into a pooled buffer.
     
-    def get_duration(self, audio_path: str) -> Optional[float]:
-        """
-        Get duration of audio file in seconds.
+    Args:
+        audio_path: Path to input audio file
+        output_args: ffmpeg output format options (e.g. ['-f', 'f32le'])
+        bytes_per_sample: Output bytes per sample, used to size the buffer
         
-        Args:
-            audio_path: Path to audio file
-            
-        Returns:
-            Duration in seconds, or None if cannot be determined
-        """
-        if not os.path.exists(audio_path):
-            return None
+    Returns:
+        Tuple of (buffer, number of bytes written to it)
         
+    Raises:
+        ValueError: If ffmpeg fails to decode the file
+    """
+    # Size the buffer from the WAV header, or assume an MP3 expands
+    # by about bytes_per_sample times its size at 16kHz mono
+    if _ext(audio_path) == '.wav':
         try:
-            # Try using soundfile first (faster for WAV)
-            file_ext = Path(audio_path).suffix.lower()
-            
-            if file_ext == '.wav':
-                info = sf.info(audio_path)
-                return info.duration
-            else:
-                # Use pydub for other formats
-                audio = AudioSegment.from_file(audio_path)
-                return len(audio) / 1000.0  # Convert milliseconds to seconds
-                
-        except Exception as e:
-            print(f"Warning: Could not determine audio duration: {str(e)}")
-            return None
+            duration = _metadata(audio_path)["duration"]
+            expected = int(duration * TARGET_SAMPLE_RATE) * bytes_per_sample + 4096
+        except Exception:
+            expected = os.path.getsize(audio_path)
+    else:
+        expected = os.path.getsize(audio_path) * bytes_per_sample
+    
+    buf = _buffer_pool.get(expected)
+    length = 0
     
-    def validate_audio(self, audio_path: str) -> dict:
-        """
-        Validate audio file and return its properties.
+    # stderr goes to a file so a flood of decode warnings can't fill
+    # the pipe and stall ffmpeg while stdout is being read
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(
+            [
+                FFMPEG_BIN, '-v', 'error', '-nostdin',
+                '-i', audio_path,
+                '-ar', str(TARGET_SAMPLE_RATE),
+                '-ac', str(TARGET_CHANNELS),
+                *output_args,
+                'pipe:1'
+            ],
+            stdout=subprocess.PIPE,
+            stderr=stderr
+        )
+        with process:
+            while True:
+                if length == len(buf):
+                    # Output is longer than estimated - move to a bigger buffer
+                    bigger = _buffer_pool.get(len(buf) * 2)
+                    bigger[:length] = buf
+                    _buffer_pool.put(buf)
+                    buf = bigger
+                with memoryview(buf) as view:
+                    read = process.stdout.readinto(view[length:])
+                if not read:
+                    break
+                length += read
         
-        Args:
-            audio_path: Path to audio file
-            
-        Returns:
-            Dictionary with validation results:
-            - valid: Boolean indicating if file is valid
-            - format: File format
-            - duration: Duration in seconds
-            - sample_rate: Sample rate in Hz
-            - channels: Number of audio channels
-            - error: Error message if invalid
-        """
-        result = {
-            "valid": False,
-            "format": None,
-            "duration": None,
-            "sample_rate": None,
-            "channels": None,
-            "error": None
-        }
+        if process.returncode != 0:
+            _buffer_pool.put(buf)
+            stderr.seek(0)
+            error = stderr.read().decode(errors='replace').strip()
+            raise ValueError(f"Failed to load audio file: {error}")
+    
+    return buf, length
+
+
+def release(samples: np.ndarray):
+    """
+    Recycle the buffer behind a waveform returned by decode_to_array().
+    
+    The array must not be used afterwards. Arrays that don't come
+    from the buffer pool are ignored.
+    
+    Args:
+        samples: Waveform returned by decode_to_array()
+    """
+    base = samples.base
+    if isinstance(base, memoryview) and isinstance(base.obj, bytearray):
+        _buffer_pool.put(base.obj)
+
+
+def _is_target_wav(audio_path: str) -> bool:
+    """
+    Check from the WAV header whether a file is already 16kHz mono 16-bit PCM.
+    
+    Only the header is read through the metadata cache, which parses it
+    directly from a memory map (_wav_header_probe) and falls back to
+    soundfile for headers it doesn't handle. This is much cheaper than
+    decoding the file, and the result is shared with validate_audio()
+    and get_duration().
+    
+    Args:
+        audio_path: Path to a .wav file
         
-        if not os.path.exists(audio_path):
-            result["error"] = "File does not exist"
-            return result
+    Returns:
+        True if the file can be used for speech recognition as-is
+    """
+    try:
+        metadata = _metadata(audio_path)
+    except Exception:
+        # Unreadable header - let the conversion path report the error
+        return False
+    
+    return (
+        metadata["sample_rate"] == TARGET_SAMPLE_RATE and
+        metadata["channels"] == TARGET_CHANNELS and
+        metadata["sample_width"] == TARGET_SAMPLE_WIDTH
+    )
+
+
+def _convert_audio(audio: AudioSegment) -> np.ndarray:
+    """
+    Convert audio to target specifications.
+    
+    Args:
+        audio: Pydub AudioSegment
         
-        file_ext = Path(audio_path).suffix.lower()
-        result["format"] = file_ext
+    Returns:
+        1-D float32 array of 16kHz mono samples in [-1, 1]
+    """
+    audio = audio.set_sample_width(TARGET_SAMPLE_WIDTH)
+    samples = np.frombuffer(audio.raw_data, dtype=np.int16)
+    frame_rate = audio.frame_rate
+    
+    # Convert to mono if stereo, averaging the interleaved channels
+    if audio.channels > 1:
+        samples = samples.reshape(-1, audio.channels).mean(axis=1, dtype=np.float32)
+    
+    # Without soxr, fall back to pydub's resampler on the mono PCM data
+    if frame_rate != TARGET_SAMPLE_RATE and not SOXR_AVAILABLE:
+        mono = AudioSegment(
+            data=samples.astype(np.int16).tobytes(),
+            sample_width=TARGET_SAMPLE_WIDTH,
+            frame_rate=frame_rate,
+            channels=TARGET_CHANNELS
+        ).set_frame_rate(TARGET_SAMPLE_RATE)
+        samples = np.frombuffer(mono.raw_data, dtype=np.int16)
+        frame_rate = TARGET_SAMPLE_RATE
+    
+    # 16-bit PCM to float32 in [-1, 1], the range Whisper expects
+    samples = samples.astype(np.float32, copy=False) / 32768.0
+    
+    # Resample to target sample rate
+    if frame_rate != TARGET_SAMPLE_RATE:
+        samples = soxr.resample(samples, frame_rate, TARGET_SAMPLE_RATE)
+    
+    return samples
+
+
+def _metadata(audio_path: str) -> dict:
+    """
+    Get cached metadata for an audio file.
+    
+    Args:
+        audio_path: Path to audio file
         
-        if file_ext not in self.SUPPORTED_FORMATS:
-            result["error"] = f"Unsupported format: {file_ext}"
-            return result
+    Returns:
+        Dictionary from _probe for the file's current contents
+    """
+    path = os.path.abspath(audio_path)
+    stat = os.stat(path)
+    return _probe(path, stat.st_mtime_ns, stat.st_size)
+
+
+def get_duration_from_segment(audio: AudioSegment) -> float:
+    """
+    Get duration of an already loaded AudioSegment in seconds.
+    
+    Args:
+        audio: Pydub AudioSegment
         
-        try:
-            audio = AudioSegment.from_file(audio_path)
-            
-            result["valid"] = True
-            result["duration"] = len(audio) / 1000.0
-            result["sample_rate"] = audio.frame_rate
-            result["channels"] = audio.channels
-            
-            # Additional validation
-            if result["duration"] < 0.5:
-                result["valid"] = False
-                result["error"] = "Audio is too short (less than 0.5 seconds)"
-            
-        except Exception as e:
-            result["error"] = f"Failed to process audio: {str(e)}"
+    Returns:
+        Duration in seconds
+    """
+    return len(audio) / 1000.0  # Convert milliseconds to seconds
+
+
+def get_duration(audio_path: str) -> Optional[float]:
+    """
+    Get duration of audio file in seconds.
+    
+    Callers that already ran validate_audio() should read its
+    "duration" field instead; both come from the same cached probe.
+    
+    Args:
+        audio_path: Path to audio file
         
-        return result
+    Returns:
+        Duration in seconds, or None if cannot be determined
+    """
+    if not os.path.exists(audio_path):
+        return None
+    
+    try:
+        return _metadata(audio_path)["duration"]
+    except Exception as e:
+        logger.warning("Could not determine audio duration: %s", e)
+        return None
+
+
+def validate_audio(audio_path: str) -> dict:
+    """
+    Validate audio file and return its properties.
     
-    def get_audio_info(self, audio_path: str) -> dict:
-        """
-        Get detailed information about an audio file.
+    Args:
+        audio_path: Path to audio file
         
-        Args:
-            audio_path: Path to audio file
-            
-        Returns:
-            Dictionary with audio information
-        """
-        info = {
-            "path": audio_path,
-            "exists": os.path.exists(audio_path),
-            "format": Path(audio_path).suffix.lower() if audio_path else None,
-            "size_bytes": None,
-            "duration_seconds": None,
-            "sample_rate_hz": None,
-            "channels": None,
-            "bit_depth": None
-        }
+    Returns:
+        Dictionary with validation results:
+        - valid: Boolean indicating if file is valid
+        - format: File format
+        - duration: Duration in seconds
+        - sample_rate: Sample rate in Hz
+        - channels: Number of audio channels
+        - error: Error message if invalid
+    """
+    result = {
+        "valid": False,
+        "format": None,
+        "duration": None,
+        "sample_rate": None,
+        "channels": None,
+        "error": None
+    }
+    
+    if not os.path.exists(audio_path):
+        result["error"] = "File does not exist"
+        return result
+    
+    file_ext = _ext(audio_path)
+    result["format"] = file_ext
+    
+    if file_ext not in SUPPORTED_FORMATS:
+        result["error"] = f"Unsupported format: {file_ext}"
+        return result
+    
+    try:
+        metadata = _metadata(audio_path)
         
-        if not info["exists"]:
-            return info
+        result["valid"] = True
+        result["duration"] = metadata["duration"]
+        result["sample_rate"] = metadata["sample_rate"]
+        result["channels"] = metadata["channels"]
         
-        info["size_bytes"] = os.path.getsize(audio_path)
+        # Additional validation
+        if result["duration"] < 0.5:
+            result["valid"] = False
+            result["error"] = "Audio is too short (less than 0.5 seconds)"
         
-        try:
-            audio = AudioSegment.from_file(audio_path)
-            info["duration_seconds"] = len(audio) / 1000.0
-            info["sample_rate_hz"] = audio.frame_rate
-            info["channels"] = audio.channels
-            info["bit_depth"] = audio.sample_width * 8
-        except Exception:
-            pass
+    except Exception as e:
+        result["error"] = f"Failed to process audio: {str(e)}"
+    
+    return result
+
+
+def get_audio_info(audio_path: str) -> dict:
+    """
+    Get detailed information about an audio file.
+    
+    Args:
+        audio_path: Path to audio file
         
+    Returns:
+        Dictionary with audio information
+    """
+    info = {
+        "path": audio_path,
+        "exists": os.path.exists(audio_path),
+        "format": _ext(audio_path) if audio_path else None,
+        "size_bytes": None,
+        "duration_seconds": None,
+        "sample_rate_hz": None,
+        "channels": None,
+        "bit_depth": None
+    }
+    
+    if not info["exists"]:
         return info
+    
+    info["size_bytes"] = os.path.getsize(audio_path)
+    
+    try:
+        metadata = _metadata(audio_path)
+        info["duration_seconds"] = metadata["duration"]
+        info["sample_rate_hz"] = metadata["sample_rate"]
+        info["channels"] = metadata["channels"]
+        if metadata["sample_width"]:
+            info["bit_depth"] = metadata["sample_width"] * 8
+    except Exception:
+        pass
+    
+    return info
+
+
+def process_audio_batch(audio_paths: Sequence[str]) -> List[str]:
+    """
+    Process many audio files in parallel worker processes.
+    
+    The pydub fallback decodes in Python and holds the GIL, so files
+    are spread over one process per CPU core instead of being
+    converted one after another.
+    
+    Args:
+        audio_paths: Paths to input audio files
+        
+    Returns:
+        Processed audio paths, in the same order as the input
+        
+    Raises:
+        FileNotFoundError: If an audio file doesn't exist
+        ValueError: If an audio format is not supported
+    """
+    return list(_get_process_pool().map(process_audio, audio_paths))
 
 
-# Singleton instance
-_audio_processor_instance = None
+def validate_audio_batch(audio_paths: Sequence[str]) -> List[dict]:
+    """
+    Validate many audio files in parallel worker processes.
+    
+    Args:
+        audio_paths: Paths to audio files
+        
+    Returns:
+        Validation results (see validate_audio()), in input order
+    """
+    return list(_get_process_pool().map(validate_audio, audio_paths))
 
-def get_audio_processor() -> AudioProcessor:
+
+class AudioProcessor:
     """
-    Get singleton instance of AudioProcessor.
+    Utility class for processing audio files.
+    
+    Handles audio format conversion and validation for
+    speech recognition compatibility. The processor holds no state,
+    so this is a thin namespace over the module-level functions,
+    kept for existing callers.
+    """
+    
+    SUPPORTED_FORMATS = SUPPORTED_FORMATS
+    TARGET_FORMAT = TARGET_FORMAT
+    TARGET_SAMPLE_RATE = TARGET_SAMPLE_RATE
+    TARGET_CHANNELS = TARGET_CHANNELS
+    TARGET_SAMPLE_WIDTH = TARGET_SAMPLE_WIDTH
+    
+    process_audio = staticmethod(process_audio)
+    process_audio_to_bytes = staticmethod(process_audio_to_bytes)
+    decode_to_array = staticmethod(decode_to_array)
+    release = staticmethod(release)
+    get_duration = staticmethod(get_duration)
+    get_duration_from_segment = staticmethod(get_duration_from_segment)
+    validate_audio = staticmethod(validate_audio)
+    get_audio_info = staticmethod(get_audio_info)
+    process_audio_batch = staticmethod(process_audio_batch)
+    validate_audio_batch = staticmethod(validate_audio_batch)
+
+
+def get_audio_processor() -> ModuleType:
+    """
+    Get the audio processor.
+    
+    Processing is stateless, so this returns the audio_utils module
+    itself, which exposes the same functions and constants as
+    AudioProcessor without a per-call instance.
     
     Returns:
-        AudioProcessor instance
+        The audio_utils module
     """
-    global _audio_processor_instance
-    if _audio_processor_instance is None:
-        _audio_processor_instance = AudioProcessor()
-    return _audio_processor_instance
+    return sys.modules[__name__]
@@ -14,17 +14,27 @@ Or use the interactive mode:
 
 import requests
 import argparse
+import mimetypes
 import os
 import sys
 
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 
 API_BASE_URL = "http://localhost:8000"
 
+# Shared session so consecutive calls reuse one keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 
 def check_health():
     """Check if the API is running."""
     try:
-        response = requests.get(f"{API_BASE_URL}/health")
+        response = SESSION.get(f"{API_BASE_URL}/health")
         if response.status_code == 200:
             print("✅ API is healthy!")
             print(f"   Response: {response.json()}")
@@ -41,7 +51,7 @@ def check_health():
 def list_chapters():
     """List all available chapters."""
     try:
-        response = requests.get(f"{API_BASE_URL}/chapters")
+        response = SESSION.get(f"{API_BASE_URL}/chapters")
         if response.status_code == 200:
             chapters = response.json()["chapters"]
             print("\n📚 Available Chapters:")
@@ -63,7 +73,7 @@ def list_chapters():
 def get_chapter_text(chapter_id):
     """Get the text of a specific chapter."""
     try:
-        response = requests.get(f"{API_BASE_URL}/chapters/{chapter_id}")
+        response = SESSION.get(f"{API_BASE_URL}/chapters/{chapter_id}")
         if response.status_code == 200:
             chapter = response.json()
             print(f"\n📖 Chapter: {chapter['title']}")
@@ -97,16 +107,29 @@ def assess_audio(audio_path, chapter_id):
     
     try:
         with open(audio_path, "rb") as audio_file:
-            files = {"audio": (os.path.basename(audio_path), audio_file)}
-            data = {"chapter_id": chapter_id}
-            
             print("⏳ Processing... (This may take a moment for the first request)")
-            response = requests.post(
-                f"{API_BASE_URL}/assess/audio",
-                files=files,
-                data=data,
-                timeout=300  # 5 minutes timeout for first load
-            )
+            if MultipartEncoder is not None:
+                # Stream the file in chunks instead of building the whole body in memory
+                content_type = mimetypes.guess_type(audio_path)[0] or "application/octet-stream"
+                encoder = MultipartEncoder(fields={
+                    "chapter_id": chapter_id,
+                    "audio": (os.path.basename(audio_path), audio_file, content_type)
+                })
+                response = SESSION.post(
+                    f"{API_BASE_URL}/assess/audio",
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
+                    timeout=300  # 5 minutes timeout for first load
+                )
+            else:
+                files = {"audio": (os.path.basename(audio_path), audio_file)}
+                data = {"chapter_id": chapter_id}
+                response = SESSION.post(
+                    f"{API_BASE_URL}/assess/audio",
+                    files=files,
+                    data=data,
+                    timeout=300  # 5 minutes timeout for first load
+                )
         
         if response.status_code == 200:
             result = response.json()
@@ -6,164 +6,328 @@ Unit tests for verifying the functionality of services.
 Run tests with: pytest tests/test_services.py -v
 """
 
+import asyncio
+import io
 import pytest
 import os
+import subprocess
 import sys
+import threading
+import wave
+
+import numpy as np
+import orjson
+import soundfile as sf
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.services.text_service import TextService
+from app.services.text_service import TextService, get_text_service
 from app.services.evaluation_service import EvaluationService
 from app.services.chapter_service import ChapterService
+from app.utils.audio_utils import AudioProcessor, FFMPEG_BIN, _BufferPool
+
+
+def write_wav(path, sample_rate=16000, channels=1, duration=1.0):
+    """Write a silent 16-bit PCM WAV file for audio tests."""
+    with wave.open(str(path), 'wb') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(b'\x00\x00' * channels * int(sample_rate * duration))
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def text_service():
+    """Text service shared by the tests in this module."""
+    return TextService(fuzzy_threshold=80)
+
+
+@pytest.fixture(scope="module")
+def evaluation_service():
+    """Evaluation service shared by the tests in this module."""
+    return EvaluationService()
+
+
+@pytest.fixture(scope="module")
+def chapter_service():
+    """Chapter service on the default data path, loaded once per module."""
+    return ChapterService()
+
+
+@pytest.fixture(scope="module")
+def audio_processor():
+    """Audio processor shared by the tests in this module."""
+    return AudioProcessor()
 
 
 class TestTextService:
     """Test cases for TextService."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.text_service = TextService(fuzzy_threshold=80)
-    
-    def test_normalize_basic(self):
+    def test_normalize_basic(self, text_service):
         """Test basic text normalization."""
         input_text = "Hello, World! How are you?"
         expected = "hello world how are you"
-        result = self.text_service.normalize(input_text)
+        result = text_service.normalize(input_text)
         assert result == expected
     
-    def test_normalize_extra_spaces(self):
+    def test_normalize_extra_spaces(self, text_service):
         """Test removal of extra spaces."""
         input_text = "Hello    World   Test"
         expected = "hello world test"
-        result = self.text_service.normalize(input_text)
+        result = text_service.normalize(input_text)
         assert result == expected
     
-    def test_normalize_punctuation(self):
+    def test_normalize_punctuation(self, text_service):
         """Test punctuation removal."""
         input_text = "Hello! What's up? Let's go."
         # Apostrophes are kept for contractions
         expected = "hello what's up let's go"
-        result = self.text_service.normalize(input_text)
+        result = text_service.normalize(input_text)
         assert result == expected
     
-    def test_normalize_empty(self):
+    def test_normalize_empty(self, text_service):
         """Test empty string normalization."""
-        assert self.text_service.normalize("") == ""
-        assert self.text_service.normalize(None) == ""
+        assert text_service.normalize("") == ""
+        assert text_service.normalize(None) == ""
     
-    def test_tokenize(self):
+    def test_tokenize(self, text_service):
         """Test text tokenization."""
         input_text = "hello world test"
         expected = ["hello", "world", "test"]
-        result = self.text_service.tokenize(input_text)
+        result = text_service.tokenize(input_text)
         assert result == expected
     
-    def test_tokenize_empty(self):
+    def test_tokenize_empty(self, text_service):
         """Test empty string tokenization."""
-        assert self.text_service.tokenize("") == []
-        assert self.text_service.tokenize(None) == []
+        assert text_service.tokenize("") == []
+        assert text_service.tokenize(None) == []
     
-    def test_compare_texts_exact_match(self):
+    def test_compare_texts_exact_match(self, text_service):
         """Test comparison with exact matching text."""
         student = "hello world test"
         reference = "hello world test"
         
-        result = self.text_service.compare_texts(student, reference)
+        result = text_service.compare_texts(student, reference)
         
         assert result['matched_words'] == 3
         assert result['total_student_words'] == 3
         assert result['total_reference_words'] == 3
         assert len(result['exact_matches']) == 3
     
-    def test_compare_texts_partial_match(self):
+    def test_compare_texts_partial_match(self, text_service):
         """Test comparison with partial matching text."""
         student = "hello world"
         reference = "hello world test example"
         
-        result = self.text_service.compare_texts(student, reference)
+        result = text_service.compare_texts(student, reference)
         
         assert result['matched_words'] == 2
         assert result['total_student_words'] == 2
         assert result['total_reference_words'] == 4
     
-    def test_compare_texts_fuzzy_match(self):
+    def test_compare_texts_fuzzy_match(self, text_service):
         """Test fuzzy matching for similar words."""
         student = "helo wrold"  # Typos
         reference = "hello world"
         
-        result = self.text_service.compare_texts(student, reference, use_fuzzy=True)
+        result = text_service.compare_texts(student, reference, use_fuzzy=True)
         
         # Should match via fuzzy matching
         assert result['matched_words'] >= 1  # At least one fuzzy match
+    
+    def test_compare_texts_fuzzy_match_pairs(self, text_service):
+        """Test that each fuzzy match pairs a word with its closest unused reference word."""
+        student = "the quik brown foxx"
+        reference = "the quick brown fox"
+        
+        result = text_service.compare_texts(student, reference)
+        
+        assert [(s, r) for s, r, _ in result['fuzzy_matches']] == [("quik", "quick"), ("foxx", "fox")]
+        assert all(score >= 80 for _, _, score in result['fuzzy_matches'])
+        assert result['unmatched_reference'] == []
+    
+    def test_compare_texts_exact_match_takes_priority(self, text_service):
+        """Test that a fuzzy match doesn't use up a word read exactly later."""
+        student = "bat bats"
+        reference = "bats"
+        
+        result = text_service.compare_texts(student, reference, include_details=True)
+        
+        assert result['exact_matches'] == ["bats"]
+        assert result['fuzzy_matches'] == []
+        assert result['unmatched_student'] == ["bat"]
+        assert [d['match_type'] for d in result['match_details']] == [None, "exact"]
+    
+    def test_compare_texts_exact_only(self, text_service):
+        """Test comparison with fuzzy matching disabled."""
+        student = "the cat sat on teh mat the"
+        reference = "the cat sat on the mat"
+        
+        result = text_service.compare_texts(student, reference, use_fuzzy=False)
+        
+        assert result['matched_words'] == 6
+        assert result['exact_matches'] == ["the", "cat", "sat", "on", "mat", "the"]
+        assert result['fuzzy_matches'] == []
+        assert result['unmatched_student'] == ["teh"]
+        assert result['unmatched_reference'] == []
+    
+    def test_compare_texts_batch_matches_single(self, text_service):
+        """Test that batch comparison gives the same results as compare_texts."""
+        reference = "the quick brown fox jumps over the lazy dog"
+        students = [
+            "the quik brown foxx jumps over teh lazy dog",
+            "the quick brown fox",
+            "",
+            "a completely different sentence",
+        ]
+        
+        batch = text_service.compare_texts_batch(students, reference, include_details=True)
+        
+        assert batch == [
+            text_service.compare_texts(student, reference, include_details=True)
+            for student in students
+        ]
+    
+    def test_compare_texts_details_opt_in(self, text_service):
+        """Test that per-word match details are only built on request."""
+        result = text_service.compare_texts("hello world", "hello world")
+        assert result['match_details'] == []
+        assert result['matched_words'] == 2
+    
+    def test_get_text_service_one_instance_per_threshold(self):
+        """Test each threshold value maps to a single shared instance."""
+        service = get_text_service()
+        
+        assert get_text_service(80) is service
+        assert get_text_service(fuzzy_threshold=80) is service
+        assert get_text_service(90) is not service
+    
+    def test_word_order_accuracy(self, text_service):
+        """Test word order accuracy based on longest common subsequence."""
+        reference = ["the", "cat", "sat", "on", "the", "mat"]
+        
+        assert text_service.get_word_order_accuracy(reference, reference) == 100.0
+        
+        # LCS of the reordered words is "the cat on the mat" (5 of 6 words)
+        student = ["sat", "the", "cat", "on", "the", "mat"]
+        accuracy = text_service.get_word_order_accuracy(student, reference)
+        assert accuracy == pytest.approx(5 / 6 * 100)
+        
+        assert text_service.get_word_order_accuracy([], reference) == 0.0
+    
+    def test_word_order_accuracy_from_compare_ids(self, text_service):
+        """Test that token IDs from compare_texts give the same word order accuracy."""
+        student = "sat the cat on the mat"
+        reference = "the cat sat on the mat"
+        
+        result = text_service.compare_texts(student, reference)
+        from_ids = text_service.get_word_order_accuracy(
+            result['student_ids'], 
+            result['reference_ids']
+        )
+        from_tokens = text_service.get_word_order_accuracy(
+            student.split(), 
+            reference.split()
+        )
+        
+        assert from_ids == from_tokens
 
 
 class TestEvaluationService:
     """Test cases for EvaluationService."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.evaluation_service = EvaluationService()
-    
-    def test_calculate_accuracy_full(self):
+    def test_calculate_accuracy_full(self, evaluation_service):
         """Test accuracy calculation with full match."""
-        accuracy = self.evaluation_service.calculate_accuracy(10, 10)
+        accuracy = evaluation_service.calculate_accuracy(10, 10)
         assert accuracy == 100.0
     
-    def test_calculate_accuracy_partial(self):
+    def test_calculate_accuracy_partial(self, evaluation_service):
         """Test accuracy calculation with partial match."""
-        accuracy = self.evaluation_service.calculate_accuracy(8, 10)
+        accuracy = evaluation_service.calculate_accuracy(8, 10)
         assert accuracy == 80.0
     
-    def test_calculate_accuracy_zero(self):
+    def test_calculate_accuracy_zero(self, evaluation_service):
         """Test accuracy calculation with zero words."""
-        accuracy = self.evaluation_service.calculate_accuracy(0, 0)
+        accuracy = evaluation_service.calculate_accuracy(0, 0)
         assert accuracy == 0.0
     
-    def test_calculate_completeness(self):
+    def test_calculate_completeness(self, evaluation_service):
         """Test completeness calculation."""
-        completeness = self.evaluation_service.calculate_completeness(15, 20)
+        completeness = evaluation_service.calculate_completeness(15, 20)
         assert completeness == 75.0
     
-    def test_calculate_fluency(self):
+    def test_calculate_fluency(self, evaluation_service):
         """Test fluency (WPM) calculation."""
         # 120 words in 60 seconds = 120 WPM
-        fluency = self.evaluation_service.calculate_fluency(120, 60)
+        fluency = evaluation_service.calculate_fluency(120, 60)
         assert fluency == 120.0
     
-    def test_calculate_fluency_zero_duration(self):
+    def test_calculate_fluency_zero_duration(self, evaluation_service):
         """Test fluency with zero duration."""
-        fluency = self.evaluation_service.calculate_fluency(100, 0)
+        fluency = evaluation_service.calculate_fluency(100, 0)
         assert fluency == 0.0
     
-    def test_detect_suspicious_normal(self):
+    def test_detect_suspicious_normal(self, evaluation_service):
         """Test suspicious detection for normal speed."""
-        is_suspicious = self.evaluation_service.detect_suspicious_reading(150)
+        is_suspicious = evaluation_service.detect_suspicious_reading(150)
         assert is_suspicious is False
     
-    def test_detect_suspicious_fast(self):
+    def test_detect_suspicious_fast(self, evaluation_service):
         """Test suspicious detection for very fast speed."""
-        is_suspicious = self.evaluation_service.detect_suspicious_reading(300)
+        is_suspicious = evaluation_service.detect_suspicious_reading(300)
         assert is_suspicious is True
     
-    def test_categorize_speed(self):
+    def test_categorize_speed(self, evaluation_service):
         """Test speed categorization."""
-        assert self.evaluation_service.categorize_speed(50) == "very_slow"
-        assert self.evaluation_service.categorize_speed(80) == "slow"
-        assert self.evaluation_service.categorize_speed(130) == "normal"
-        assert self.evaluation_service.categorize_speed(180) == "fast"
-        assert self.evaluation_service.categorize_speed(220) == "very_fast"
-        assert self.evaluation_service.categorize_speed(300) == "suspicious"
-    
-    def test_get_grade(self):
+        assert evaluation_service.categorize_speed(50) == "very_slow"
+        assert evaluation_service.categorize_speed(80) == "slow"
+        assert evaluation_service.categorize_speed(130) == "normal"
+        assert evaluation_service.categorize_speed(180) == "fast"
+        assert evaluation_service.categorize_speed(220) == "very_fast"
+        assert evaluation_service.categorize_speed(300) == "suspicious"
+    
+    def test_evaluate_batch_matches_evaluate(self, evaluation_service):
+        """Test that batch evaluation gives the same metrics as evaluate()."""
+        submissions = [
+            # (matched, total_student, total_reference, duration, word_count)
+            (18, 20, 25, 10.0, 20),
+            (5, 10, 50, 2.0, 10),
+            (0, 0, 30, 0.0, 0),
+            # Durations whose WPM lands within rounding of a speed edge
+            (30, 33, 40, 9.9, 33),
+            (90, 97, 100, 29.1, 97),
+        ]
+        
+        batch = evaluation_service.evaluate_batch(*zip(*submissions))
+        
+        for i, (matched, student, reference, duration, words) in enumerate(submissions):
+            single = evaluation_service.evaluate(
+                comparison_result={
+                    'matched_words': matched,
+                    'total_student_words': student,
+                    'total_reference_words': reference
+                },
+                audio_duration=duration,
+                word_count=words
+            )
+            assert batch['accuracy'][i] == pytest.approx(single['accuracy'])
+            assert batch['completeness'][i] == pytest.approx(single['completeness'])
+            assert batch['fluency_wpm'][i] == pytest.approx(single['fluency_wpm'])
+            assert batch['suspicious'][i] == single['suspicious']
+            assert batch['reading_speed_category'][i] == single['breakdown']['reading_speed_category']
+            assert batch['remarks'][i] == single['remarks']
+    
+    def test_get_grade(self, evaluation_service):
         """Test grade calculation."""
-        assert self.evaluation_service.get_grade(95, 90) == "A"
-        assert self.evaluation_service.get_grade(85, 80) == "B"
-        assert self.evaluation_service.get_grade(75, 70) == "C"
-        assert self.evaluation_service.get_grade(65, 60) == "D"
-        assert self.evaluation_service.get_grade(40, 30) == "F"
+        assert evaluation_service.get_grade(95, 90) == "A"
+        assert evaluation_service.get_grade(85, 80) == "B"
+        assert evaluation_service.get_grade(75, 70) == "C"
+        assert evaluation_service.get_grade(65, 60) == "D"
+        assert evaluation_service.get_grade(40, 30) == "F"
     
-    def test_evaluate_full(self):
+    def test_evaluate_full(self, evaluation_service):
         """Test full evaluation pipeline."""
         comparison_result = {
             'matched_words': 40,
@@ -173,7 +337,7 @@ class TestEvaluationService:
             'fuzzy_matches': [('wrold', 'world', 85)] * 5
         }
         
-        result = self.evaluation_service.evaluate(
+        result = evaluation_service.evaluate(
             comparison_result=comparison_result,
             audio_duration=30,  # 30 seconds
             word_count=50
@@ -194,14 +358,9 @@ class TestEvaluationService:
 class TestChapterService:
     """Test cases for ChapterService."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        # Use the default data path
-        self.chapter_service = ChapterService()
-    
-    def test_list_chapters(self):
+    def test_list_chapters(self, chapter_service):
         """Test listing chapters."""
-        chapters = self.chapter_service.list_chapters()
+        chapters = chapter_service.list_chapters()
         
         assert isinstance(chapters, list)
         assert len(chapters) >= 1
@@ -212,40 +371,378 @@ class TestChapterService:
             assert 'title' in chapter
             assert 'word_count' in chapter
     
-    def test_get_chapter_text_exists(self):
+    def test_get_chapter_text_exists(self, chapter_service):
         """Test getting text for existing chapter."""
-        text = self.chapter_service.get_chapter_text('chapter_1')
+        text = chapter_service.get_chapter_text('chapter_1')
         
         assert text is not None
         assert isinstance(text, str)
         assert len(text) > 0
     
-    def test_get_chapter_text_not_exists(self):
+    def test_get_chapter_text_not_exists(self, chapter_service):
         """Test getting text for non-existent chapter."""
-        text = self.chapter_service.get_chapter_text('non_existent_chapter')
+        text = chapter_service.get_chapter_text('non_existent_chapter')
         assert text is None
     
-    def test_get_chapter_details(self):
+    def test_get_chapter_details(self, chapter_service):
         """Test getting full chapter details."""
-        chapter = self.chapter_service.get_chapter('chapter_1')
+        chapter = chapter_service.get_chapter('chapter_1')
         
         assert chapter is not None
         assert 'id' in chapter
         assert 'title' in chapter
         assert 'text' in chapter
+    
+    def test_get_reference_cached(self):
+        """Test reference data is computed once and reused."""
+        calls = []
+        
+        def normalize(text):
+            calls.append(text)
+            return TextService().normalize(text)
+        
+        # A fresh service, so the shared fixture's cache doesn't hide the first call
+        chapter_service = ChapterService()
+        first = chapter_service.get_reference('chapter_1', normalize)
+        second = chapter_service.get_reference('chapter_1', normalize)
+        
+        assert first is second
+        assert first['normalized'] == first['normalized'].lower()
+        assert len(calls) == 1
+        assert chapter_service.get_reference('non_existent_chapter', normalize) is None
+    
+    def test_get_reference(self, text_service, chapter_service):
+        """Test precomputed reference data for a chapter."""
+        reference = chapter_service.get_reference('chapter_1', text_service.normalize)
+        
+        assert reference['text'] == chapter_service.get_chapter_text('chapter_1')
+        assert reference['tokens'] == text_service.tokenize(reference['normalized'])
+        assert reference['text'].startswith(reference['prompt'])
+        assert len(reference['prompt'].split()) <= ChapterService.PROMPT_MAX_WORDS
+    
+    def test_get_reference_not_cached_across_edit(self, tmp_path, text_service):
+        """Test a reference built while its chapter is edited is not cached."""
+        chapter_service = ChapterService(data_path=str(tmp_path / "chapters.json"))
+        chapter_service.add_chapter('chapter_x', 'Test Chapter', 'Old text.')
+        
+        def normalize_during_edit(text):
+            # The chapter changes while its old text is being normalized
+            chapter_service.update_chapter('chapter_x', text='New text.')
+            return text_service.normalize(text)
+        
+        stale = chapter_service.get_reference('chapter_x', normalize_during_edit)
+        assert stale['text'] == 'Old text.'
+        
+        reference = chapter_service.get_reference('chapter_x', text_service.normalize)
+        assert reference['text'] == 'New text.'
+    
+    def test_add_chapter_persists(self, tmp_path):
+        """Test added chapters are saved and reloaded from disk."""
+        chapter_service = ChapterService(data_path=str(tmp_path / "chapters.json"))
+        
+        assert chapter_service.add_chapter('chapter_x', 'Test Chapter', 'Some text here.')
+        assert not chapter_service.add_chapter('chapter_x', 'Duplicate', 'Other text.')
+        
+        reloaded = ChapterService(data_path=str(tmp_path / "chapters.json"))
+        assert reloaded.get_chapter_text('chapter_x') == 'Some text here.'
+        assert reloaded.get_chapter('chapter_1') is not None
+    
+    def test_background_flush_coalesces_writes(self, tmp_path):
+        """Test edits are written once by the background flusher."""
+        data_path = tmp_path / "chapters.json"
+        chapter_service = ChapterService(data_path=str(data_path))
+        chapter_service.list_chapters()  # Creates the default file
+        
+        async def edit_chapters():
+            chapter_service.start_background_flush(interval=0.01)
+            chapter_service.add_chapter('chapter_x', 'Test Chapter', 'Some text.')
+            chapter_service.update_chapter('chapter_x', text='Updated text.')
+            
+            # Nothing is written until the flusher runs
+            assert 'chapter_x' not in data_path.read_text(encoding='utf-8')
+            
+            await chapter_service.stop_background_flush()
+        
+        asyncio.run(edit_chapters())
+        
+        reloaded = ChapterService(data_path=str(data_path))
+        assert reloaded.get_chapter_text('chapter_x') == 'Updated text.'
+    
+    def test_failed_flush_is_retried(self, tmp_path, monkeypatch):
+        """Test changes stay pending after a failed write and the flusher keeps running."""
+        data_path = tmp_path / "chapters.json"
+        chapter_service = ChapterService(data_path=str(data_path))
+        chapter_service.list_chapters()  # Creates the default file
+        
+        real_replace = os.replace
+        failures = []
+        
+        def replace_once_failing(src, dst):
+            if not failures:
+                failures.append(src)
+                raise OSError("No space left on device")
+            real_replace(src, dst)
+        
+        monkeypatch.setattr(os, "replace", replace_once_failing)
+        
+        async def edit_chapters():
+            chapter_service.start_background_flush(interval=0.01)
+            chapter_service.add_chapter('chapter_x', 'Test Chapter', 'Some text.')
+            
+            # The first write fails; the flusher retries on a later tick
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if 'chapter_x' in data_path.read_text(encoding='utf-8'):
+                    break
+            
+            assert not chapter_service._flush_task.done()
+            await chapter_service.stop_background_flush()
+        
+        asyncio.run(edit_chapters())
+        
+        assert failures
+        reloaded = ChapterService(data_path=str(data_path))
+        assert reloaded.get_chapter_text('chapter_x') == 'Some text.'
+    
+    def test_edit_during_flush_is_not_lost(self, tmp_path, monkeypatch):
+        """Test an edit made while a flush serializes the data is written later."""
+        data_path = tmp_path / "chapters.json"
+        chapter_service = ChapterService(data_path=str(data_path))
+        chapter_service.list_chapters()  # Creates the default file
+        
+        real_dumps = orjson.dumps
+        editors = []
+        
+        def dumps_then_edit(*args, **kwargs):
+            content = real_dumps(*args, **kwargs)
+            if not editors:
+                # Another thread edits right after the snapshot is serialized
+                editor = threading.Thread(
+                    target=chapter_service.add_chapter,
+                    args=('chapter_y', 'Late Chapter', 'Late text.')
+                )
+                editors.append(editor)
+                editor.start()
+                editor.join(timeout=0.1)
+            return content
+        
+        monkeypatch.setattr(orjson, "dumps", dumps_then_edit)
+        
+        async def edit_chapters():
+            chapter_service.start_background_flush(interval=3600)
+            chapter_service.add_chapter('chapter_x', 'Test Chapter', 'Some text.')
+            await asyncio.to_thread(chapter_service.flush)
+            editors[0].join()
+            await chapter_service.stop_background_flush()
+        
+        asyncio.run(edit_chapters())
+        
+        reloaded = ChapterService(data_path=str(data_path))
+        assert reloaded.get_chapter_text('chapter_x') == 'Some text.'
+        assert reloaded.get_chapter_text('chapter_y') == 'Late text.'
+
+
+class TestAudioProcessor:
+    """Test cases for AudioProcessor."""
+    
+    def test_process_audio_target_wav_unchanged(self, audio_processor, tmp_path):
+        """Test 16kHz mono WAV is used as-is without conversion."""
+        audio_path = write_wav(tmp_path / "sample.wav")
+        assert audio_processor.process_audio(audio_path) == audio_path
+    
+    def test_process_audio_target_extensible_wav_unchanged(self, audio_processor, tmp_path):
+        """Test 16kHz mono 16-bit WAVE_FORMAT_EXTENSIBLE files are used as-is."""
+        audio_path = str(tmp_path / "sample.wav")
+        sf.write(audio_path, np.zeros(16000, dtype=np.int16), 16000, subtype='PCM_16', format='WAVEX')
+        assert audio_processor.process_audio(audio_path) == audio_path
+    
+    @pytest.mark.parametrize("subtype, file_format", [
+        ('PCM_16', 'WAV'),
+        ('PCM_24', 'WAV'),
+        ('FLOAT', 'WAV'),
+        ('PCM_16', 'WAVEX'),
+        ('ULAW', 'WAV')
+    ])
+    def test_audio_info_matches_soundfile(self, audio_processor, tmp_path, subtype, file_format):
+        """Test WAV header parsing agrees with soundfile across sample formats."""
+        audio_path = str(tmp_path / "sample.wav")
+        sf.write(audio_path, np.zeros((33075, 2), dtype=np.float32), 22050, subtype=subtype, format=file_format)
+        expected = sf.info(audio_path)
+        info = audio_processor.get_audio_info(audio_path)
+        
+        assert info["duration_seconds"] == pytest.approx(expected.duration)
+        assert info["sample_rate_hz"] == expected.samplerate
+        assert info["channels"] == expected.channels
+    
+    def test_get_duration_wav(self, audio_processor, tmp_path):
+        """Test duration of a WAV file."""
+        audio_path = write_wav(tmp_path / "sample.wav", duration=2.0)
+        assert audio_processor.get_duration(audio_path) == pytest.approx(2.0)
+    
+    @pytest.mark.skipif(FFMPEG_BIN is None, reason="ffmpeg not installed")
+    @pytest.mark.parametrize("options", [
+        ['-b:a', '128k'],
+        ['-b:a', '128k', '-write_xing', '0'],
+        ['-q:a', '4']
+    ])
+    def test_get_duration_mp3_from_header(self, audio_processor, tmp_path, monkeypatch, options):
+        """Test MP3 duration is read from frame headers without mutagen or ffprobe."""
+        monkeypatch.setattr("app.utils.audio_utils.MUTAGEN_AVAILABLE", False)
+        monkeypatch.setattr("app.utils.audio_utils.FFPROBE_BIN", None)
+        audio_path = str(tmp_path / "sample.mp3")
+        subprocess.run(
+            [FFMPEG_BIN, '-v', 'error', '-f', 'lavfi', '-i', 'sine=duration=3',
+             '-ac', '2', '-ar', '44100', *options, audio_path],
+            check=True
+        )
+        
+        assert audio_processor.get_duration(audio_path) == pytest.approx(3.0, abs=0.1)
+    
+    def test_audio_metadata_follows_file_changes(self, audio_processor, tmp_path):
+        """Test cached metadata is refreshed when the file is rewritten."""
+        audio_path = write_wav(tmp_path / "sample.wav", duration=1.0)
+        validation = audio_processor.validate_audio(audio_path)
+        info = audio_processor.get_audio_info(audio_path)
+        
+        assert validation["valid"]
+        assert validation["duration"] == pytest.approx(1.0)
+        assert info["sample_rate_hz"] == 16000
+        assert info["channels"] == 1
+        assert info["bit_depth"] == 16
+        
+        write_wav(audio_path, sample_rate=22050, channels=2, duration=2.0)
+        info = audio_processor.get_audio_info(audio_path)
+        
+        assert info["duration_seconds"] == pytest.approx(2.0)
+        assert info["sample_rate_hz"] == 22050
+        assert info["channels"] == 2
+    
+    def test_decode_to_array_target_wav(self, audio_processor, tmp_path):
+        """Test decoding a 16kHz mono WAV to a float32 waveform."""
+        audio_path = write_wav(tmp_path / "sample.wav", duration=1.5)
+        samples = audio_processor.decode_to_array(audio_path)
+        
+        assert samples.dtype.name == 'float32'
+        assert samples.ndim == 1
+        assert len(samples) == 24000
+    
+    @pytest.mark.skipif(FFMPEG_BIN is None, reason="ffmpeg not installed")
+    def test_process_audio_converts_with_ffmpeg(self, audio_processor, tmp_path):
+        """Test 44.1kHz stereo WAV is converted to 16kHz mono."""
+        audio_path = write_wav(tmp_path / "sample.wav", sample_rate=44100, channels=2)
+        processed_path = audio_processor.process_audio(audio_path)
+        
+        try:
+            assert processed_path != audio_path
+            with wave.open(processed_path, 'rb') as wav_file:
+                assert wav_file.getframerate() == 16000
+                assert wav_file.getnchannels() == 1
+                assert wav_file.getsampwidth() == 2
+        finally:
+            os.unlink(processed_path)
+    
+    def test_process_audio_converts_without_ffmpeg(self, audio_processor, tmp_path, monkeypatch):
+        """Test the in-process fallback converts 44.1kHz stereo WAV to 16kHz mono."""
+        monkeypatch.setattr("app.utils.audio_utils.FFMPEG_BIN", None)
+        audio_path = write_wav(tmp_path / "sample.wav", sample_rate=44100, channels=2)
+        processed_path = audio_processor.process_audio(audio_path)
+        
+        try:
+            assert processed_path != audio_path
+            with wave.open(processed_path, 'rb') as wav_file:
+                assert wav_file.getframerate() == 16000
+                assert wav_file.getnchannels() == 1
+                assert wav_file.getsampwidth() == 2
+                assert wav_file.getnframes() == pytest.approx(16000, abs=16)
+        finally:
+            os.unlink(processed_path)
+    
+    @pytest.mark.skipif(FFMPEG_BIN is None, reason="ffmpeg not installed")
+    def test_decode_to_array_resamples_with_ffmpeg(self, audio_processor, tmp_path):
+        """Test 44.1kHz stereo WAV is decoded to a 16kHz mono waveform."""
+        audio_path = write_wav(tmp_path / "sample.wav", sample_rate=44100, channels=2, duration=1.0)
+        samples = audio_processor.decode_to_array(audio_path)
+        
+        assert samples.dtype.name == 'float32'
+        assert samples.ndim == 1
+        assert len(samples) == pytest.approx(16000, abs=16)
+    
+    @pytest.mark.skipif(FFMPEG_BIN is None, reason="ffmpeg not installed")
+    def test_release_recycles_decode_buffer(self, audio_processor, tmp_path):
+        """Test a released waveform's buffer is reused by the next decode."""
+        audio_path = write_wav(tmp_path / "sample.wav", sample_rate=44100, channels=2, duration=1.0)
+        samples = audio_processor.decode_to_array(audio_path)
+        buffer = samples.base.obj
+        audio_processor.release(samples)
+        
+        samples = audio_processor.decode_to_array(audio_path)
+        assert samples.base.obj is buffer
+        assert len(samples) == pytest.approx(16000, abs=16)
+    
+    def test_buffer_pool_drops_oversized_buffers(self):
+        """Test the buffer pool frees large buffers and respects its byte budget."""
+        pool = _BufferPool(max_buffer_bytes=4096, max_total_bytes=8192)
+        
+        # Above the size limit: exact size, never kept
+        large = pool.get(5000)
+        assert len(large) == 5000
+        pool.put(large)
+        assert pool.pooled_bytes == 0
+        assert pool.get(5000) is not large
+        
+        # Within the limit: reused until the total budget is reached
+        buffers = [pool.get(4096) for _ in range(3)]
+        for buf in buffers:
+            pool.put(buf)
+        assert pool.pooled_bytes == 8192
+        assert pool.get(4096) is buffers[1]
+        assert pool.pooled_bytes == 4096
+    
+    def test_batch_processing_keeps_input_order(self, audio_processor, tmp_path):
+        """Test batch helpers return one result per file, in order."""
+        audio_paths = [
+            write_wav(tmp_path / "short.wav", duration=0.25),
+            write_wav(tmp_path / "long.wav", duration=2.0)
+        ]
+        
+        assert audio_processor.process_audio_batch(audio_paths) == audio_paths
+        
+        results = audio_processor.validate_audio_batch(audio_paths)
+        assert [result["valid"] for result in results] == [False, True]
+        assert results[1]["duration"] == pytest.approx(2.0)
+    
+    @pytest.mark.parametrize("use_ffmpeg", [
+        pytest.param(True, marks=pytest.mark.skipif(FFMPEG_BIN is None, reason="ffmpeg not installed")),
+        False
+    ])
+    def test_process_audio_to_bytes(self, audio_processor, tmp_path, monkeypatch, use_ffmpeg):
+        """Test in-memory conversion yields a complete 16kHz mono WAV."""
+        if not use_ffmpeg:
+            monkeypatch.setattr("app.utils.audio_utils.FFMPEG_BIN", None)
+        audio_path = write_wav(tmp_path / "sample.wav", sample_rate=44100, channels=2)
+        wav_bytes = audio_processor.process_audio_to_bytes(audio_path)
+        
+        with wave.open(io.BytesIO(wav_bytes), 'rb') as wav_file:
+            assert wav_file.getframerate() == 16000
+            assert wav_file.getnchannels() == 1
+            assert wav_file.getsampwidth() == 2
+            assert wav_file.getnframes() == pytest.approx(16000, abs=16)
+            assert len(wav_file.readframes(wav_file.getnframes())) == wav_file.getnframes() * 2
+    
+    def test_process_audio_unsupported_format(self, audio_processor, tmp_path):
+        """Test unsupported formats are rejected."""
+        audio_path = tmp_path / "sample.ogg"
+        audio_path.write_bytes(b"OggS")
+        with pytest.raises(ValueError):
+            audio_processor.process_audio(str(audio_path))
 
 
 # Integration test example
 class TestIntegration:
     """Integration tests for the evaluation pipeline."""
     
-    def test_full_evaluation_pipeline(self):
+    def test_full_evaluation_pipeline(self, text_service, evaluation_service, chapter_service):
         """Test the complete evaluation pipeline with sample data."""
-        # Initialize services
-        text_service = TextService()
-        evaluation_service = EvaluationService()
-        chapter_service = ChapterService()
-        
         # Get reference text
         reference_text = chapter_service.get_chapter_text('chapter_1')
         assert reference_text is not None